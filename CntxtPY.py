@@ -3,24 +3,36 @@
 import os
 import sys
 import json
-import networkx as nx
-from networkx.readwrite import json_graph
-from typing import Dict, List, Optional, Set, Any
+import hashlib
+import importlib
+import importlib.util
+import mmap
+import multiprocessing
+import pickle
+import sqlite3
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, Any
 from pathlib import Path
 import logging
 from datetime import datetime
 
+# orjson is optional; without it the graph is encoded with the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import regex modules
 try:
-    from regex_components.ConfigFileParser import ConfigFileParser
     from regex_components.DependencyMapper import DependencyMapper
     from regex_components.CodeIdentifierExtractor import CodeIdentifierExtractor, FunctionInfo, Parameter
     from regex_components.CommentProcessor import CommentProcessor
-    from regex_components.DocumentationAnalyzer import DocumentationAnalyzer
-    from regex_components.BuildConfigExtractor import BuildConfigExtractor
     from regex_components.LoggingAnalyzer import LoggingAnalyzer
     from regex_components.VersionAnalyzer import VersionAnalyzer
-    from regex_components.FileTypeProcessor import FileTypeProcessor
     from regex_components.IntegrationMapper import IntegrationMapper
     from regex_components.LocalizationProcessor import LocalizationProcessor
     from regex_components.CommentProcessor import CommentInfo, CommentType
@@ -29,20 +41,259 @@ except ImportError as e:
     print("Make sure all component files are in the 'regex_components' directory")
     sys.exit(1)
 
+
+def _load_component(module_name: str, class_name: str):
+    """Import a regex component class on first use."""
+    try:
+        module = importlib.import_module(f"regex_components.{module_name}")
+    except ImportError as e:
+        print(f"Error importing regex components: {str(e)}")
+        print("Make sure all component files are in the 'regex_components' directory")
+        sys.exit(1)
+    return getattr(module, class_name)
+
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# File classification tables
+BUILD_FILES = frozenset({"setup.py", "requirements.txt", "Pipfile", "pyproject.toml"})
+# Build file name -> (build tool, DependencyMapper method that extracts its dependencies)
+BUILD_TOOLS = {
+    "setup.py": ("setuptools", "extract_setup_dependencies"),
+    "setup.cfg": ("setuptools", "extract_setup_dependencies"),
+    "requirements.txt": ("requirements", "extract_requirements"),
+    "Pipfile": ("pipenv", "extract_pipfile_dependencies"),
+    "pyproject.toml": ("poetry", "extract_pyproject_dependencies"),
+}
+CONFIG_EXTS = frozenset({".ini", ".env", ".cfg", ".yaml", ".yml", ".json"})
+LOCALIZATION_EXTS = frozenset({".po", ".mo"})
+DOC_FILES = frozenset({"readme.md", "readme.rst", "api.md", "docs.md"})
+
+# Categories decided by suffix alone (suffix matching is case-sensitive)
+CATEGORY_BY_EXT = {
+    ".py": 'python',
+    **dict.fromkeys(CONFIG_EXTS, 'config'),
+    **dict.fromkeys(LOCALIZATION_EXTS, 'localization'),
+}
+
+
+# Files at least this large are decoded straight from a memory map
+MMAP_THRESHOLD = 256 * 1024
+
+
+def _read_source(file_path: str) -> str:
+    """
+    Read a source file as bytes and decode it in one pass.
+
+    Large files are memory-mapped so the decode reads the page cache directly
+    instead of going through an intermediate bytes copy. Newlines are
+    normalized the way text mode would, but only when the file actually
+    contains a carriage return.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                content = str(mm, 'utf-8')
+        else:
+            content = f.read().decode('utf-8')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+def _content_hash(value: Any) -> int:
+    """
+    Hash node content to a stable 64-bit integer.
+
+    Unlike hash(), the result does not depend on the process's hash seed, so
+    comment and log node ids are the same across runs.
+    """
+    if not isinstance(value, str):
+        value = f"{type(value).__name__}:{value!r}"
+    digest = hashlib.blake2b(value.encode('utf-8', 'surrogatepass'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big')
+
+
+def _default_parse_cache_path() -> Optional[str]:
+    """
+    Return the per-user location of the parse cache, or None when the cache
+    has not been turned on with CNTXTPY_PARSE_CACHE=1.
+
+    The cache is opt-in because its entries are unpickled when read, and a
+    cached result only goes stale when PARSE_CACHE_VERSION is bumped.
+    """
+    if os.environ.get('CNTXTPY_PARSE_CACHE') != '1':
+        return None
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'cntxtpy', 'parse_cache.db')
+
+
+# Values json can encode without help
+_JSON_SAFE = (str, int, float, bool, type(None))
+
+
+def _to_json_safe(value: Any) -> Any:
+    """Return value in a JSON-serializable form, stringifying anything json can't encode."""
+    if isinstance(value, _JSON_SAFE):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_to_json_safe(item) for item in value]
+    if isinstance(value, dict):
+        return {str(key): _to_json_safe(item) for key, item in value.items()}
+    return str(value)
+
+
+class _RecordView:
+    """
+    Re-iterable stand-in for a list of node-link records.
+
+    Every pass rebuilds the records from the graph buffers, so a consumer
+    that walks them more than once still never holds them all at once.
+    """
+    __slots__ = ('_records',)
+
+    def __init__(self, records: Callable[[], Iterator[Dict[str, Any]]]):
+        self._records = records
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self._records()
+
+
+class _NodeRecord:
+    """
+    Fixed-layout attribute record for the node types created in bulk.
+
+    Comment, callable and variable nodes make up most of a large graph, and a
+    slotted record is about a third the size of the equivalent dict. Records
+    read like a mapping (keys() and [key]), so {**attrs}, dict.update and
+    networkx accept them as node attributes.
+    """
+    __slots__ = ()
+
+    def keys(self):
+        return self.__slots__
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Copy the fields into a dict; about twice as fast as {**record}."""
+        return {key: getattr(self, key) for key in self.__slots__}
+
+
+@dataclass(slots=True)
+class _CommentNode(_NodeRecord):
+    type: str
+    comment_type: str
+    content: str
+    line_number: int
+    associated_element: Optional[str]
+    tags: List[str]
+    id: str
+
+
+@dataclass(slots=True)
+class _CallableNode(_NodeRecord):
+    """
+    Function or method node. Parameters are held as (name, type, default)
+    rows and only expanded into the exported {'name', 'type', 'default'}
+    dicts when the record is read as a mapping.
+    """
+    type: str
+    name: str
+    id: str
+    return_type: str
+    parameters: Tuple[Tuple[str, str, Any], ...]
+    decorators: List[str]
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'parameters':
+            return self._expand_parameters()
+        return _NodeRecord.__getitem__(self, key)
+
+    def to_dict(self) -> Dict[str, Any]:
+        record = _NodeRecord.to_dict(self)
+        record['parameters'] = self._expand_parameters()
+        return record
+
+    def _expand_parameters(self) -> List[Dict[str, Any]]:
+        return [
+            {'name': name, 'type': type_hint, 'default': default}
+            for name, type_hint, default in self.parameters
+        ]
+
+
+@dataclass(slots=True)
+class _VariableNode(_NodeRecord):
+    type: str
+    name: str
+    id: str
+    value: Any
+    type_hint: str
+
+
+# Worker-side analyzer, built once per pool process by _init_worker
+_worker_graph = None
+
+
+def _init_worker(directory: str):
+    """Pool initializer: set up the regex components once per worker process."""
+    global _worker_graph
+    _worker_graph = PythonCodeKnowledgeGraph(directory, workers=1)
+
+
+def _analyze_file(task: tuple) -> Dict[str, Any]:
+    """Pool task: extract a (path, category) file's contents without touching the graph."""
+    return _worker_graph._extract_file(*task)
+
 
 class PythonCodeKnowledgeGraph:
-    def __init__(self, directory: str):
-        """Initialize the knowledge graph generator."""
+    # Categories analyzed ahead of the merge loop, in worker processes when worthwhile
+    EXTRACTED_CATEGORIES = frozenset({'python', 'config', 'documentation', 'generic'})
+    # Extracted categories whose results are kept in the parse cache
+    CACHED_CATEGORIES = frozenset({'python', 'config'})
+    # Below this many such files the pool startup costs more than it saves
+    PARALLEL_THRESHOLD = 32
+    # Serial analysis reads this many files ahead on this many threads
+    PREFETCH_WINDOW = 16
+    IO_THREADS = 4
+    # Above this many nodes visualize_graph avoids the full spring layout
+    LARGE_LAYOUT_NODES = 2000
+    # Bump whenever an analyzer's output changes, so stale cached results are ignored
+    PARSE_CACHE_VERSION = 5
+
+    def __init__(self, directory: str, workers: Optional[int] = None, parse_cache: Optional[str] = None):
+        """
+        Initialize the knowledge graph generator.
+
+        parse_cache is the path of an SQLite file in which the analysis of
+        Python, config and build files is kept between runs; caching is off
+        when it is None. Cached results are unpickled, so only point it at a
+        file this user wrote.
+        """
         self.directory = directory
-        self.graph = nx.DiGraph()
+        self.parse_cache = parse_cache
+        self._parse_cache_db = None
+        # Walked paths are joined onto the directory, so slicing this prefix off
+        # yields the same result as os.path.relpath without normalizing
+        self._dir_prefix = directory if directory.endswith(os.sep) else directory + os.sep
+        self.workers = workers or os.cpu_count() or 1
+        # Graph buffers: node id -> attributes, and source -> {target: relation}.
+        # The graph is write-only until export, so plain dicts replace nx.DiGraph.
+        self.nodes: Dict[str, Any] = {}
+        self.edges: Dict[str, Dict[str, str]] = {}
         self.files_processed = 0
         self.total_files = 0
         self.dirs_processed = 0
         self.analyzed_files = set()
         self.module_map = {}
+        # The per-node debug messages are skipped outright unless debug logging
+        # is on; refreshed at the start of each analysis
+        self._log_debug = logging.getLogger().isEnabledFor(logging.DEBUG)
 
         # Initialize statistics
         self.stats = {
@@ -51,7 +302,7 @@ class PythonCodeKnowledgeGraph:
             'total_modules': set(),
             'total_imports': 0,
             'total_dependencies': set(),
-            'total_annotations': set(),
+            'total_annotations': 0,
             'total_logging_statements': 0,
             'files_with_errors': 0,
             'total_comments': 0,
@@ -73,20 +324,39 @@ class PythonCodeKnowledgeGraph:
         try:
             # Pass the directory when initializing the VersionAnalyzer
             self.version_analyzer = VersionAnalyzer(directory=self.directory)
-            self.config_parser = ConfigFileParser()
             self.dependency_mapper = DependencyMapper()
             self.code_extractor = CodeIdentifierExtractor()
             self.comment_processor = CommentProcessor()
-            self.doc_analyzer = DocumentationAnalyzer()
-            self.build_extractor = BuildConfigExtractor()
             self.log_analyzer = LoggingAnalyzer()
-            self.file_processor = FileTypeProcessor()
             self.integration_mapper = IntegrationMapper()
             self.localization_processor = LocalizationProcessor()
         except Exception as e:
             logging.error(f"Error initializing processors: {str(e)}")
             raise
 
+    # Analyzers for non-Python files are created on first use, so their modules
+    # (and yaml/chardet) are only imported when the codebase has such files
+
+    @cached_property
+    def config_parser(self):
+        """Configuration file parser."""
+        return _load_component('ConfigFileParser', 'ConfigFileParser')()
+
+    @cached_property
+    def doc_analyzer(self):
+        """Documentation file analyzer."""
+        return _load_component('DocumentationAnalyzer', 'DocumentationAnalyzer')()
+
+    @cached_property
+    def build_extractor(self):
+        """Build configuration extractor."""
+        return _load_component('BuildConfigExtractor', 'BuildConfigExtractor')()
+
+    @cached_property
+    def file_processor(self):
+        """Generic file type processor."""
+        return _load_component('FileTypeProcessor', 'FileTypeProcessor')()
+
     def _init_ignored_paths(self):
         """Initialize sets of ignored directories and files."""
         self.ignored_directories = {
@@ -99,338 +369,623 @@ class PythonCodeKnowledgeGraph:
             '.gitignore', '.DS_Store', 'Thumbs.db', '.env', '.env.example'
         }
 
-    def _add_dependency_node(self, build_node: str, dep_info: Dict[str, str]):
-        """Add a dependency node to the graph."""
-        dep_id = f"{dep_info['name']}=={dep_info.get('version', '')}"
-        dep_node = f"Dependency: {dep_id}"
-        if not self.graph.has_node(dep_node):
-            self.graph.add_node(
-                dep_node,
-                type="dependency",
-                name=dep_info['name'],
-                version=dep_info.get('version', ''),
-                id=dep_node
-            )
-            self.stats['total_dependencies'].add(dep_id)
-        self.graph.add_edge(build_node, dep_node, relation="DEPENDS_ON")
+    def _add_node(self, node_id: str, **attrs):
+        """Add a node, or update its attributes if it already exists."""
+        node = self.nodes.get(node_id)
+        if node is None:
+            self.nodes[node_id] = attrs
+        else:
+            node.update(attrs)
+
+    def _add_edge(self, source: str, target: str, relation: str):
+        """Add a directed edge, creating bare endpoint nodes as needed."""
+        if source not in self.nodes:
+            self.nodes[source] = {}
+        if target not in self.nodes:
+            self.nodes[target] = {}
+        # Re-adding an edge keeps its position and takes the latest relation
+        self.edges.setdefault(source, {})[target] = relation
+
+    def _link(self, source: str, target: str, relation: str):
+        """Add a directed edge between two nodes already in the graph."""
+        targets = self.edges.get(source)
+        if targets is None:
+            self.edges[source] = {target: relation}
+        else:
+            targets[target] = relation
+
+    def _link_many(self, source: str, targets: List[str], relation: str):
+        """Add edges from source to each of targets, all already in the graph."""
+        if targets:
+            self.edges.setdefault(source, {}).update(dict.fromkeys(targets, relation))
+
+    def _iter_node_records(self):
+        """Yield node-link records for the nodes, in insertion order."""
+        for node_id, attrs in self.nodes.items():
+            if type(attrs) is dict:
+                yield {**attrs, 'id': node_id}
+            else:
+                record = attrs.to_dict()
+                record['id'] = node_id
+                yield record
+
+    def _iter_link_records(self):
+        """Yield node-link records for the edges, ordered by source node like networkx."""
+        edges = self.edges
+        for source in self.nodes:
+            targets = edges.get(source)
+            if targets:
+                for target, relation in targets.items():
+                    yield {'relation': relation, 'source': source, 'target': target}
+
+    def _write_graph_json(self, f, metadata: Dict[str, Any]):
+        """
+        Write the graph and metadata to binary file f as indented JSON, one record at a time.
+
+        The layout matches json.dump(..., indent=2) over the combined document,
+        without first building the node and link lists in memory. Records are
+        encoded with orjson when it is installed.
+        """
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+            def dumps(obj):
+                return orjson.dumps(obj, option=option)
+        else:
+            def dumps(obj):
+                return json.dumps(obj, indent=2).encode('utf-8')
+
+        def write_records(key, records):
+            f.write(b'    "%s": [' % key)
+            first = True
+            for record in records:
+                f.write(b'\n      ' if first else b',\n      ')
+                # Encoded strings never contain raw newlines, so this only re-indents
+                f.write(dumps(record).replace(b'\n', b'\n      '))
+                first = False
+            f.write(b']' if first else b'\n    ]')
+
+        f.write(b'{\n  "graph": {\n    "directed": true,\n    "multigraph": false,\n')
+        write_records(b'nodes', self._iter_node_records())
+        f.write(b',\n')
+        write_records(b'links', self._iter_link_records())
+        f.write(b'\n  },\n  "metadata": ')
+        f.write(dumps(metadata).replace(b'\n', b'\n  '))
+        f.write(b'\n}')
+
+    def to_networkx(self) -> 'nx.DiGraph':
+        """Build a networkx DiGraph from the graph buffers."""
+        # networkx is only needed here and for visualization, so it is not
+        # imported unless the caller asks for a DiGraph
+        import networkx as nx
+
+        graph = nx.DiGraph()
+        graph.add_nodes_from(self.nodes.items())
+        graph.add_edges_from(
+            (source, target, {'relation': relation})
+            for source, targets in self.edges.items()
+            for target, relation in targets.items()
+        )
+        return graph
+
+    def _add_dependency_nodes(self, build_node: str, dependencies: List[Any]):
+        """Add dependency nodes to the graph and link them to the build script in one pass."""
+        dep_nodes = []
+        for dep in dependencies:
+            dep_id = f"{dep.name}=={dep.version}"
+            dep_node = f"Dependency: {dep_id}"
+            if dep_node not in self.nodes:
+                self._add_node(
+                    dep_node,
+                    type="dependency",
+                    name=dep.name,
+                    version=dep.version,
+                    id=dep_node
+                )
+                self.stats['total_dependencies'].add(dep_id)
+            dep_nodes.append(dep_node)
+        self._link_many(build_node, dep_nodes, "DEPENDS_ON")
 
     def analyze_codebase(self):
         """Analyze the Python codebase and build the knowledge graph."""
         logging.info("Starting codebase analysis...")
+        self._log_debug = logging.getLogger().isEnabledFor(logging.DEBUG)
 
-        # Count files first
-        self._count_files()
+        # Walk the tree once; the file count falls out of the collected list
+        files = list(self._iter_candidate_files())
+        self.total_files = sum(1 for _, category in files if category != 'generic')
+        logging.info(f"Found {self.total_files} files to process")
 
         # Process the codebase
-        self._process_codebase()
+        try:
+            self._process_codebase(files)
+        finally:
+            self._close_parse_cache()
 
         logging.info(f"Completed analysis of {self.files_processed} files")
         if self.stats['files_with_errors'] > 0:
             logging.warning(f"Encountered errors in {self.stats['files_with_errors']} files")
 
-    def _count_files(self):
-        """Count total files to be processed."""
-        for root, dirs, files in os.walk(self.directory):
-            dirs[:] = [d for d in dirs if d not in self.ignored_directories]
-
-            if not any(ignored in root.split(os.sep) for ignored in self.ignored_directories):
-                self.total_files += sum(
-                    1 for f in files
-                    if f.endswith(".py") and f not in self.ignored_files
-                )
-                # Include build files
-                self.total_files += sum(
-                    1 for f in files
-                    if f in {"setup.py", "requirements.txt", "Pipfile", "pyproject.toml"} and f not in self.ignored_files
-                )
-                # Include config files
-                self.total_files += sum(
-                    1 for f in files
-                    if f.endswith((".ini", ".env", ".cfg", ".yaml", ".yml", ".json")) and f not in self.ignored_files
-                )
-                # Include localization files
-                self.total_files += sum(
-                    1 for f in files
-                    if f.endswith((".po", ".mo")) and f not in self.ignored_files
-                )
-                # Include README and documentation files
-                self.total_files += sum(
-                    1 for f in files
-                    if f.lower() in {"readme.md", "readme.rst", "api.md", "docs.md"} and f not in self.ignored_files
+    def _open_parse_cache(self) -> Optional[sqlite3.Connection]:
+        """Open the parse cache on first use, or return None when caching is off or unavailable."""
+        if self._parse_cache_db is None and self.parse_cache:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.parse_cache)), exist_ok=True)
+                db = sqlite3.connect(self.parse_cache)
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS parse_cache ("
+                    "path TEXT, kind TEXT, version INTEGER, mtime_ns INTEGER, size INTEGER, data BLOB, "
+                    "PRIMARY KEY (path, kind))"
                 )
+                self._parse_cache_db = db
+            except (sqlite3.Error, OSError) as e:
+                logging.warning(f"Parse cache disabled, could not open {self.parse_cache}: {e}")
+                self.parse_cache = None
+        return self._parse_cache_db
+
+    def _close_parse_cache(self):
+        """Commit and close the parse cache if it was opened."""
+        if self._parse_cache_db is not None:
+            try:
+                self._parse_cache_db.commit()
+                self._parse_cache_db.close()
+            except sqlite3.Error as e:
+                logging.warning(f"Could not save parse cache: {e}")
+            self._parse_cache_db = None
+
+    def _parse_cache_key(self, file_path: str, kind: str) -> tuple:
+        """Return the cache key for a file: its path, the kind of parse, and its mtime and size."""
+        path = os.path.abspath(file_path)
+        st = os.stat(path)
+        return (path, kind, self.PARSE_CACHE_VERSION, st.st_mtime_ns, st.st_size)
+
+    def _parse_cache_get(self, db: sqlite3.Connection, key: tuple) -> Any:
+        """Return the cached result for key, or None on a miss."""
+        try:
+            row = db.execute(
+                "SELECT data FROM parse_cache WHERE path = ? AND kind = ? AND version = ? "
+                "AND mtime_ns = ? AND size = ?",
+                key
+            ).fetchone()
+            if row is not None:
+                return pickle.loads(row[0])
+        except Exception as e:
+            # A stale or corrupt entry is just a miss
+            logging.debug("Parse cache miss for %s: %s", key[0], e)
+        return None
 
-        logging.info(f"Found {self.total_files} files to process")
+    def _parse_cache_put(self, db: sqlite3.Connection, key: tuple, result: Any):
+        """Store a parse result under key, replacing any older entry for the file."""
+        try:
+            db.execute(
+                "INSERT OR REPLACE INTO parse_cache VALUES (?, ?, ?, ?, ?, ?)",
+                key + (pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL),)
+            )
+        except (sqlite3.Error, pickle.PicklingError) as e:
+            logging.debug("Could not cache parse of %s: %s", key[0], e)
 
-    def _process_codebase(self):
-        """Process all files in the codebase."""
-        for root, dirs, files in os.walk(self.directory):
-            dirs[:] = [d for d in dirs if d not in self.ignored_directories]
+    def _cached_parse(self, file_path: str, kind: str, parse):
+        """
+        Return parse(file_path), reusing the result of an earlier run when the
+        file's mtime and size are unchanged. None results are not cached.
+        """
+        db = self._open_parse_cache()
+        if db is None:
+            return parse(file_path)
+
+        key = self._parse_cache_key(file_path, kind)
+        result = self._parse_cache_get(db, key)
+        if result is None:
+            result = parse(file_path)
+            if result is not None:
+                self._parse_cache_put(db, key, result)
+        return result
+
+    def _cached_results(self, files: List[tuple]):
+        """
+        Look up the cached analysis of each Python and config file.
 
-            if any(ignored in root.split(os.sep) for ignored in self.ignored_directories):
+        Returns the hits by path, and the cache keys of the misses so their
+        fresh results can be stored once they are merged.
+        """
+        hits, miss_keys = {}, {}
+        db = self._open_parse_cache()
+        if db is None:
+            return hits, miss_keys
+        cached_categories = self.CACHED_CATEGORIES
+        for file_path, category in files:
+            if category not in cached_categories:
+                continue
+            try:
+                key = self._parse_cache_key(file_path, category)
+            except OSError:
+                continue
+            extracted = self._parse_cache_get(db, key)
+            if extracted is None:
+                miss_keys[file_path] = key
+            else:
+                hits[file_path] = extracted
+        return hits, miss_keys
+
+    def _relative_path(self, path: str) -> str:
+        """Return path relative to the analyzed directory."""
+        if path.startswith(self._dir_prefix):
+            return path[len(self._dir_prefix):] or os.curdir
+        return os.path.relpath(path, self.directory)
+
+    def _iter_candidate_files(self):
+        """Walk the codebase once, yielding (file_path, category) for every non-ignored file."""
+        if not self.ignored_directories.isdisjoint(self.directory.split(os.sep)):
+            return
+        yield from self._scan_directory(self.directory)
+
+    def _scan_directory(self, root: str):
+        """
+        Scan a directory tree with os.scandir, pruning ignored directories.
+
+        DirEntry type checks reuse the information from readdir, so no extra stat
+        calls are made. Directories are taken from an explicit stack rather than
+        by recursing through nested generators, so a yielded path does not have
+        to pass back up one generator per directory level. Subdirectories are
+        pushed in reverse, which keeps os.walk's top-down order.
+        """
+        stack = [root]
+        while stack:
+            path = stack.pop()
+            try:
+                with os.scandir(path) as it:
+                    entries = list(it)
+            except OSError:
                 continue
 
-            rel_path = os.path.relpath(root, self.directory)
             self.dirs_processed += 1
-            logging.debug(f"Processing directory [{self.dirs_processed}]: {rel_path}")
-
-            for file in files:
-                if file in self.ignored_files:
-                    continue
-
-                file_path = os.path.join(root, file)
-                relative_path = os.path.relpath(file_path, self.directory)
-
-                if file.endswith(".py"):
-                    self._process_python_file(file_path)
-                elif file in {"setup.py", "requirements.txt", "Pipfile", "pyproject.toml"}:
-                    self._process_build_file(file_path)
-                elif file.endswith((".ini", ".env", ".cfg", ".yaml", ".yml", ".json")):
-                    self._process_config_file(file_path)
-                elif file.endswith((".po", ".mo")):
-                    self._process_localization_file(file_path)
-                elif file.lower() in {"readme.md", "readme.rst", "api.md", "docs.md"}:
-                    self._process_documentation_file(file_path)
-                else:
-                    self._process_generic_file(file_path)
-
-    def _process_python_file(self, file_path: str):
-        """Process a single Python file."""
-        if file_path in self.analyzed_files:
+            logging.debug("Processing directory [%s]: %s", self.dirs_processed, self._relative_path(path))
+
+            subdirs = []
+            for entry in entries:
+                if entry.is_dir():
+                    # Like os.walk, symlinked directories are not followed
+                    if entry.name not in self.ignored_directories and not entry.is_symlink():
+                        subdirs.append(entry.path)
+                elif entry.name not in self.ignored_files:
+                    yield entry.path, self._classify_file(entry.name)
+
+            stack.extend(reversed(subdirs))
+
+    def _classify_file(self, file: str) -> str:
+        """Return the processing category for a file name."""
+        # Without a dot rfind gives -1 and the slice is the last character,
+        # which can never match a suffix key
+        category = CATEGORY_BY_EXT.get(file[file.rfind('.'):])
+        if category:
+            return category
+        if file in BUILD_FILES:
+            return 'build'
+        if file.lower() in DOC_FILES:
+            return 'documentation'
+        return 'generic'
+
+    def _process_codebase(self, files: Optional[List[tuple]] = None):
+        """Process all files in the codebase."""
+        if files is None:
+            files = list(self._iter_candidate_files())
+
+        # Python and config files unchanged since a cached run skip analysis altogether
+        cached, miss_keys = self._cached_results(files)
+
+        # Python, config, documentation and generic files are analyzed up front
+        # (in parallel when worthwhile); results are merged into the graph in
+        # walk order so the output stays deterministic.
+        extracted_categories = self.EXTRACTED_CATEGORIES
+        tasks = [
+            (file_path, category) for file_path, category in files
+            if category in extracted_categories and file_path not in cached
+        ]
+        with self._file_results(tasks) as results:
+            merge_python = self._merge_python_file
+            merge_config = self._merge_config_file
+            merge_documentation = self._merge_documentation_file
+            merge_generic = self._merge_generic_file
+
+            def cached_result(file_path, cacheable):
+                extracted = cached.pop(file_path, None)
+                if extracted is None:
+                    extracted = next(results)
+                    key = miss_keys.get(file_path)
+                    if key is not None and cacheable(extracted):
+                        self._parse_cache_put(self._parse_cache_db, key, extracted)
+                return extracted
+
+            # Files that failed to analyze are retried (and reported) next run
+            handlers = {
+                'python': lambda file_path: merge_python(
+                    file_path, cached_result(file_path, lambda extracted: 'error' not in extracted)
+                ),
+                'build': self._process_build_file,
+                'config': lambda file_path: merge_config(
+                    file_path, cached_result(file_path, lambda config_info: config_info is not None)
+                ),
+                'localization': self._process_localization_file,
+                'documentation': lambda file_path: merge_documentation(file_path, next(results)),
+                'generic': lambda file_path: merge_generic(file_path, next(results)),
+            }
+            for file_path, category in files:
+                handlers[category](file_path)
+
+    @contextmanager
+    def _file_results(self, tasks: List[tuple]):
+        """Yield an iterator of extraction results, one per (path, category) task, in input order."""
+        if self.workers <= 1 or len(tasks) < self.PARALLEL_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=self.IO_THREADS) as io_pool:
+                yield self._prefetched_results(tasks, io_pool)
             return
 
+        chunksize = max(1, min(32, len(tasks) // (self.workers * 4)))
+        with multiprocessing.Pool(self.workers, initializer=_init_worker, initargs=(self.directory,)) as pool:
+            yield pool.imap(_analyze_file, tasks, chunksize=chunksize)
+
+    def _prefetched_results(self, tasks: List[tuple], io_pool: ThreadPoolExecutor):
+        """Analyze files in order while io_pool reads the next Python sources ahead."""
+        pending = deque()
+        for file_path, category in tasks:
+            source = io_pool.submit(_read_source, file_path) if category == 'python' else None
+            pending.append((file_path, category, source))
+            if len(pending) > self.PREFETCH_WINDOW:
+                yield self._extract_file(*pending.popleft())
+        while pending:
+            yield self._extract_file(*pending.popleft())
+
+    def _extract_file(self, file_path: str, category: str, source: Optional[Future] = None) -> Dict[str, Any]:
+        """Extract a file of one of the EXTRACTED_CATEGORIES."""
+        if category == 'python':
+            return self._extract_python_file(file_path, source)
+        if category == 'config':
+            return self.config_parser.parse_config_file(file_path)
+        if category == 'documentation':
+            return self._extract_documentation_file(file_path)
+        return self._extract_generic_file(file_path)
+
+    def _extract_python_file(self, file_path: str, source: Optional[Future] = None) -> Dict[str, Any]:
+        """
+        Read and analyze a Python file, returning plain picklable data.
+
+        Safe to run in a worker process. If an analyzer fails, whatever was
+        extracted before the failure is kept alongside the error. `source` is
+        an already-submitted read of the file, if there is one.
+        """
+        extracted = {}
         try:
-            self.files_processed += 1
-            relative_path = os.path.relpath(file_path, self.directory)
-            logging.debug(f"Processing file [{self.files_processed}/{self.total_files}]: {file_path}")
+            content = _read_source(file_path) if source is None else source.result()
+            extracted['contents'] = {}
+            self._extract_file_contents(content, extracted['contents'])
+        except Exception as e:
+            extracted['error'] = str(e)
+        return extracted
+
+    def _merge_python_file(self, file_path: str, extracted: Dict[str, Any]):
+        """Add the nodes for an analyzed Python file to the graph."""
+        if file_path in self.analyzed_files:
+            return
 
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+        self.files_processed += 1
+        relative_path = self._relative_path(file_path)
+        logging.debug("Processing file [%s/%s]: %s", self.files_processed, self.total_files, file_path)
 
+        if 'contents' in extracted:
             # Add file node
             file_node = f"File: {relative_path}"
             self.analyzed_files.add(file_path)
-            self.graph.add_node(file_node, type="file", path=relative_path, encoding="UTF-8", fileType="SOURCE_CODE")
+            self._add_node(file_node, type="file", path=relative_path, encoding="UTF-8", fileType="SOURCE_CODE")
 
-            # Process file contents
-            self._process_file_contents(file_node, content, file_path)
+            self._merge_file_contents(file_node, extracted['contents'])
+            if 'error' in extracted:
+                logging.error(f"Error in _extract_file_contents for {file_node}: {extracted['error']}")
 
-        except Exception as e:
-            logging.error(f"Error processing {file_path}: {str(e)}")
+        if 'error' in extracted:
+            logging.error(f"Error processing {file_path}: {extracted['error']}")
             self.stats['files_with_errors'] += 1
 
-    def _process_file_contents(self, file_node: str, content: str, file_path: str):
-        """Process the contents of a Python file using all analyzers."""
-        try:
-            # Process imports
-            imports = self.dependency_mapper.extract_imports(content)
-            for import_name in imports:
-                self._add_import_node(file_node, import_name)
-
-            # Process classes
-            classes = self.code_extractor.extract_classes(content)
-            for class_info in classes:
-                class_name = class_info.name
-                self._add_class_node(file_node, class_name)
-
-                # Add class annotations (decorators)
-                for annotation in class_info.decorators:
-                    self._add_annotation_node(file_node, annotation)
-
-                # Process methods within the class
-                for method in class_info.methods:
-                    self._add_method_node(class_name, method)
-                    # Add method annotations (decorators)
-                    for annotation in method.decorators:
-                        self._add_annotation_node(file_node, annotation)
-
-            # Process functions
-            functions = self.code_extractor.extract_functions(content)
-            for function_info in functions:
-                self._add_function_node(file_node, function_info)
-                # Add function annotations (decorators)
-                for annotation in function_info.decorators:
-                    self._add_annotation_node(file_node, annotation)
-
-            # Process variables and constants
-            variables = self.code_extractor.extract_variables(content)
-            for variable_info in variables:
-                self._add_variable_node(file_node, variable_info)
-
-            # Process comments and documentation
-            comments = self.comment_processor.extract_comments(content)
-            for comment in comments:
-                self._add_comment_node(file_node, comment)
-
-            # Process logging statements
-            logging_statements = self.log_analyzer.extract_logs(content)
-            for log in logging_statements:
-                self._add_log_statement_node(file_node, log)
-
-            # Process integrations
-            integrations = self.integration_mapper.extract_integrations(content)
-            for integration in integrations:
-                self._add_integration_node(file_node, integration)
-
-            # Process version constraints
-            version_info = self.version_analyzer.extract_version_constraints(content)
-            if version_info:
-                self._add_version_info(file_node, version_info)
-
-            # Process localization usage
-            localizations = self.localization_processor.extract_localizations(content)
-            for localization in localizations:
-                self._add_localization_usage_node(file_node, localization)
-
-        except Exception as e:
-            logging.error(f"Error in _process_file_contents for {file_node}: {str(e)}")
-            raise
+    def _extract_file_contents(self, content: str, extracted: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run all analyzers over a Python file's contents, filling `extracted` as it goes."""
+        if extracted is None:
+            extracted = {}
+        # A list keeps the set's iteration order intact across the pickle round-trip
+        extracted['imports'] = list(self.dependency_mapper.extract_imports(content))
+        extracted['classes'], extracted['functions'] = self.code_extractor.extract_definitions(content)
+        extracted['variables'] = self.code_extractor.extract_variables(content)
+        extracted['comments'] = self.comment_processor.extract_comments(content)
+        extracted['logs'] = self.log_analyzer.extract_logs(content)
+        extracted['integrations'] = self.integration_mapper.extract_integrations(content)
+        extracted['version_info'] = self.version_analyzer.extract_version_constraints(content)
+        extracted['localizations'] = self.localization_processor.extract_localizations(content)
+        return extracted
+
+    def _merge_file_contents(self, file_node: str, extracted: Dict[str, Any]):
+        """Add the nodes and edges for a file's extracted contents to the graph."""
+        # The _add_* helpers link from file_node directly, so it must exist
+        if file_node not in self.nodes:
+            self.nodes[file_node] = {}
+
+        # Bind the helpers once; they are called per extracted item
+        add_import = self._add_import_node
+        add_class = self._add_class_node
+        add_method = self._add_method_node
+        add_function = self._add_function_node
+        add_variable = self._add_variable_node
+        add_annotation = self._add_annotation_node
+        add_comment = self._add_comment_node
+        add_log = self._add_log_statement_node
+        add_integration = self._add_integration_node
+        add_localization = self._add_localization_usage_node
+        get = extracted.get
+
+        # Process imports
+        for import_name in get('imports', ()):
+            add_import(file_node, import_name)
+
+        # Process classes
+        for class_info in get('classes', ()):
+            class_name = class_info.name
+            add_class(file_node, class_name)
+
+            # Add class annotations (decorators)
+            for annotation in class_info.decorators:
+                add_annotation(file_node, annotation)
+
+            # Process methods within the class
+            for method in class_info.methods:
+                add_method(class_name, method)
+                # Add method annotations (decorators)
+                for annotation in method.decorators:
+                    add_annotation(file_node, annotation)
+
+        # Process functions
+        for function_info in get('functions', ()):
+            add_function(file_node, function_info)
+            # Add function annotations (decorators)
+            for annotation in function_info.decorators:
+                add_annotation(file_node, annotation)
+
+        # Process variables and constants
+        for variable_info in get('variables', ()):
+            add_variable(file_node, variable_info)
+
+        # Process comments and documentation
+        for comment in get('comments', ()):
+            add_comment(file_node, comment)
+
+        # Process logging statements
+        for log in get('logs', ()):
+            add_log(file_node, log)
+
+        # Process integrations
+        for integration in get('integrations', ()):
+            add_integration(file_node, integration)
+
+        # Process version constraints
+        version_info = get('version_info')
+        if version_info:
+            self._add_version_info(file_node, version_info)
+
+        # Process localization usage
+        for localization in get('localizations', ()):
+            add_localization(file_node, localization)
+
+    # Import, class, callable, variable and decorator IDs recur across many
+    # files; interning them lets every edge share the node's key object rather
+    # than holding its own equal copy, and makes the dict lookups identity hits.
 
     def _add_import_node(self, file_node: str, import_name: str):
         """Add an import node to the graph."""
-        import_node = f"Import: {import_name}"
-        if not self.graph.has_node(import_node):
-            self.graph.add_node(import_node, type="import", name=import_name, id=import_node)
+        import_node = sys.intern(f"Import: {import_name}")
+        if import_node not in self.nodes:
+            self._add_node(import_node, type="import", name=import_name, id=import_node)
             self.stats['total_imports'] += 1
-            logging.debug(f"Import added: {import_name}, Total imports: {self.stats['total_imports']}")
-        self.graph.add_edge(file_node, import_node, relation="IMPORTS")
-        logging.debug(f"Edge added: {file_node} -> {import_node} with relation IMPORTS")
+            if self._log_debug:
+                logging.debug("Import added: %s, Total imports: %s", import_name, self.stats['total_imports'])
+        self._link(file_node, import_node, "IMPORTS")
+        if self._log_debug:
+            logging.debug("Edge added: %s -> %s with relation IMPORTS", file_node, import_node)
 
     def _add_class_node(self, file_node: str, class_name: str):
         """Add a class node to the graph."""
-        class_node = f"Class: {class_name}"
-        if not self.graph.has_node(class_node):
-            self.graph.add_node(class_node, type="class", name=class_name, id=class_node)
+        class_node = sys.intern(f"Class: {class_name}")
+        if class_node not in self.nodes:
+            self._add_node(class_node, type="class", name=class_name, id=class_node)
             self.stats['total_classes'] += 1
-            logging.debug(f"Class node added: {class_node}, Total classes: {self.stats['total_classes']}")
-        else:
-            logging.debug(f"Class node already exists: {class_node}")
+            if self._log_debug:
+                logging.debug("Class node added: %s, Total classes: %s", class_node, self.stats['total_classes'])
+        elif self._log_debug:
+            logging.debug("Class node already exists: %s", class_node)
 
-        self.graph.add_edge(file_node, class_node, relation="DEFINES")
-        logging.debug(f"Edge added: {file_node} -> {class_node} with relation DEFINES")
+        self._link(file_node, class_node, "DEFINES")
+        if self._log_debug:
+            logging.debug("Edge added: %s -> %s with relation DEFINES", file_node, class_node)
 
-    def _add_method_node(self, class_name: str, method_info: FunctionInfo):
+    def _sanitize_callable(self, info: FunctionInfo) -> Dict[str, Any]:
         """
-        Add a method node to the graph.
+        Build the JSON-serializable attributes shared by function and method nodes.
 
-        Improvements:
         - Ensures parameters and decorators are JSON-serializable.
         - Coerces sets to lists and converts enums or unknown objects to strings.
         - Handles default_value fallback if unserializable.
         """
+        # Safely convert parameters into (name, type, default) rows; see
+        # _CallableNode. Names, hints and decorators repeat across
+        # thousands of callables ('self', 'str', 'property'), so share one copy.
+        intern = sys.intern
+        parameters = tuple(
+            (intern(str(param.name)), intern(str(param.type_hint)), _to_json_safe(param.default_value))
+            for param in info.parameters
+        )
+
+        # Safely convert decorators (set, enum, etc → list of strings)
+        decorators_raw = info.decorators
+        if isinstance(decorators_raw, (set, tuple)):
+            decorators_raw = list(decorators_raw)
+
+        decorators_clean = []
+        for dec in decorators_raw:
+            try:
+                decorators_clean.append(intern(str(dec.value) if hasattr(dec, "value") else str(dec)))
+            except Exception:
+                decorators_clean.append(str(dec))  # Defensive fallback
 
-        method_name = method_info.name
-        method_node = f"Method: {method_name}"
+        return {
+            'return_type': str(info.return_type),
+            'parameters': parameters,
+            'decorators': decorators_clean
+        }
 
-        if not self.graph.has_node(method_node):
-            # Safely convert parameters
-            parameters = []
-            for param in method_info.parameters:
-                try:
-                    default_val = param.default_value
-                    json.dumps(default_val)  # Will raise if unserializable
-                except Exception:
-                    default_val = str(default_val)
-
-                parameters.append({
-                    'name': str(param.name),
-                    'type': str(param.type_hint),
-                    'default': default_val
-                })
-
-            # Safely convert decorators
-            decorators_raw = method_info.decorators
-            if isinstance(decorators_raw, (set, tuple)):
-                decorators_raw = list(decorators_raw)
-
-            decorators_clean = []
-            for dec in decorators_raw:
-                try:
-                    decorators_clean.append(str(dec.value) if hasattr(dec, "value") else str(dec))
-                except Exception:
-                    decorators_clean.append(str(dec))
+    def _add_method_node(self, class_name: str, method_info: FunctionInfo):
+        """Add a method node to the graph."""
+        method_name = method_info.name
+        method_node = sys.intern(f"Method: {method_name}")
 
-            self.graph.add_node(
-                method_node,
+        if method_node not in self.nodes:
+            self.nodes[method_node] = _CallableNode(
                 type="method",
                 name=method_name,
                 id=method_node,
-                return_type=str(method_info.return_type),
-                parameters=parameters,
-                decorators=decorators_clean
+                **self._sanitize_callable(method_info)
             )
             self.stats['total_functions'] += 1
-            logging.debug(f"Method node added: {method_node}, Total functions: {self.stats['total_functions']}")
-        else:
-            logging.debug(f"Method node already exists: {method_node}")
+            if self._log_debug:
+                logging.debug("Method node added: %s, Total functions: %s", method_node, self.stats['total_functions'])
+        elif self._log_debug:
+            logging.debug("Method node already exists: %s", method_node)
 
         # Link method to its class
         class_node = f"Class: {class_name}"
-        if self.graph.has_node(class_node):
-            self.graph.add_edge(class_node, method_node, relation="HAS_METHOD")
-            logging.debug(f"Edge added: {class_node} -> {method_node} with relation HAS_METHOD")
+        if class_node in self.nodes:
+            self._link(class_node, method_node, "HAS_METHOD")
+            if self._log_debug:
+                logging.debug("Edge added: %s -> %s with relation HAS_METHOD", class_node, method_node)
         else:
             logging.warning(f"Class node {class_node} does not exist; cannot add method {method_name}")
 
     def _add_function_node(self, file_node: str, function_info: FunctionInfo):
-        """
-        Add a function node to the graph.
-
-        Improvements:
-        - Ensures parameters and decorators are JSON-serializable.
-        - Coerces sets to lists and converts enums or unknown objects to strings.
-        - Handles default_value fallback if unserializable.
-        """
-
+        """Add a function node to the graph."""
         function_name = function_info.name
-        function_node = f"Function: {function_name}"
-
-        if not self.graph.has_node(function_node):
-            # Safely convert parameters to serializable format
-            parameters = []
-            for param in function_info.parameters:
-                try:
-                    default_val = param.default_value
-                    # Ensure default_value is serializable
-                    json.dumps(default_val)  # Will raise TypeError if not serializable
-                except Exception:
-                    default_val = str(default_val)  # Fallback to string
-
-                parameters.append({
-                    'name': str(param.name),
-                    'type': str(param.type_hint),
-                    'default': default_val
-                })
-
-            # Safely convert decorators (set, enum, etc → list of strings)
-            decorators_raw = function_info.decorators
-            if isinstance(decorators_raw, (set, tuple)):
-                decorators_raw = list(decorators_raw)
-
-            decorators_clean = []
-            for dec in decorators_raw:
-                try:
-                    decorators_clean.append(str(dec.value) if hasattr(dec, "value") else str(dec))
-                except Exception:
-                    decorators_clean.append(str(dec))  # Defensive fallback
+        function_node = sys.intern(f"Function: {function_name}")
 
-            # Add the sanitized function node
-            self.graph.add_node(
-                function_node,
+        if function_node not in self.nodes:
+            self.nodes[function_node] = _CallableNode(
                 type="function",
                 name=function_name,
                 id=function_node,
-                return_type=str(function_info.return_type),
-                parameters=parameters,
-                decorators=decorators_clean
+                **self._sanitize_callable(function_info)
             )
             self.stats['total_functions'] += 1
-            logging.debug(f"Function node added: {function_node}, Total functions: {self.stats['total_functions']}")
-        else:
-            logging.debug(f"Function node already exists: {function_node}")
+            if self._log_debug:
+                logging.debug("Function node added: %s, Total functions: %s", function_node, self.stats['total_functions'])
+        elif self._log_debug:
+            logging.debug("Function node already exists: %s", function_node)
 
         # Link function to file
-        self.graph.add_edge(file_node, function_node, relation="DEFINES")
-        logging.debug(f"Edge added: {file_node} -> {function_node} with relation DEFINES")
+        self._link(file_node, function_node, "DEFINES")
+        if self._log_debug:
+            logging.debug("Edge added: %s -> %s with relation DEFINES", file_node, function_node)
 
     def _add_variable_node(self, file_node: str, variable_info: Dict[str, Any]):
         """
@@ -441,29 +996,23 @@ class PythonCodeKnowledgeGraph:
         - Guards against malformed or unexpected input types.
         - Logs meaningful debug info and avoids crashes on invalid types.
         """
-        import json
-
         variable_name = variable_info.get('name', '<unnamed>')
-        variable_node = f"Variable: {variable_name}"
+        variable_node = sys.intern(f"Variable: {variable_name}")
 
-        # Coerce type_hint to string if needed
-        raw_type = variable_info.get('type_hint', None)
-        try:
-            type_hint = str(raw_type)
-        except Exception:
-            type_hint = "<unreadable_type_hint>"
+        # Most assignments rebind a name that already has a node, so the
+        # attribute coercion below only runs for new variables
+        if variable_node not in self.nodes:
+            # Coerce type_hint to string if needed
+            raw_type = variable_info.get('type_hint', None)
+            try:
+                type_hint = str(raw_type)
+            except Exception:
+                type_hint = "<unreadable_type_hint>"
 
-        # Coerce value to JSON-safe string or fallback
-        raw_value = variable_info.get('value', None)
-        try:
-            json.dumps(raw_value)
-            value = raw_value
-        except Exception:
-            value = str(raw_value) if raw_value is not None else None
-
-        if not self.graph.has_node(variable_node):
-            self.graph.add_node(
-                variable_node,
+            # Coerce value to JSON-safe form or fallback
+            value = _to_json_safe(variable_info.get('value', None))
+
+            self.nodes[variable_node] = _VariableNode(
                 type="variable",
                 name=variable_name,
                 id=variable_node,
@@ -471,13 +1020,15 @@ class PythonCodeKnowledgeGraph:
                 type_hint=type_hint
             )
             self.stats['total_variables'] += 1
-            logging.debug(f"Variable node added: {variable_node}, Total variables: {self.stats['total_variables']}")
-        else:
-            logging.debug(f"Variable node already exists: {variable_node}")
+            if self._log_debug:
+                logging.debug("Variable node added: %s, Total variables: %s", variable_node, self.stats['total_variables'])
+        elif self._log_debug:
+            logging.debug("Variable node already exists: %s", variable_node)
 
         # Link variable to file
-        self.graph.add_edge(file_node, variable_node, relation="HAS_VARIABLE")
-        logging.debug(f"Edge added: {file_node} -> {variable_node} with relation HAS_VARIABLE")
+        self._link(file_node, variable_node, "HAS_VARIABLE")
+        if self._log_debug:
+            logging.debug("Edge added: %s -> %s with relation HAS_VARIABLE", file_node, variable_node)
 
     def _add_annotation_node(self, file_node: str, annotation: Any):
         """
@@ -486,7 +1037,7 @@ class PythonCodeKnowledgeGraph:
         Enhancements:
         - Safely coerces decorator names to strings.
         - Handles AST nodes or malformed inputs.
-        - Tracks unique decorators using a set.
+        - Counts unique decorators as their nodes are created.
         """
         # Fallback and type-safe conversion
         if annotation is None:
@@ -499,27 +1050,28 @@ class PythonCodeKnowledgeGraph:
             except Exception:
                 annotation_str = "<unreadable_annotation>"
 
-        annotation_node = f"Decorator: {annotation_str}"
+        annotation_node = sys.intern(f"Decorator: {annotation_str}")
 
-        if not self.graph.has_node(annotation_node):
-            self.graph.add_node(
+        if annotation_node not in self.nodes:
+            self._add_node(
                 annotation_node,
                 type="decorator",
                 name=annotation_str,
                 id=annotation_node
             )
-            # Ensure stats field is initialized as a set
-            if 'total_annotations' not in self.stats or not isinstance(self.stats['total_annotations'], set):
-                self.stats['total_annotations'] = set()
-
-            if annotation_str not in self.stats['total_annotations']:
-                self.stats['total_annotations'].add(annotation_str)
-                logging.debug(f"Decorator node added: {annotation_node}, Total unique decorators: {len(self.stats['total_annotations'])}")
-        else:
-            logging.debug(f"Decorator node already exists: {annotation_node}")
-
-        self.graph.add_edge(file_node, annotation_node, relation="DECORATED_WITH")
-        logging.debug(f"Edge added: {file_node} -> {annotation_node} with relation DECORATED_WITH")
+            # There is one node per decorator name, so no separate set of
+            # names is needed to count the unique ones
+            if 'total_annotations' not in self.stats or not isinstance(self.stats['total_annotations'], int):
+                self.stats['total_annotations'] = 0
+            self.stats['total_annotations'] += 1
+            if self._log_debug:
+                logging.debug("Decorator node added: %s, Total unique decorators: %s", annotation_node, self.stats['total_annotations'])
+        elif self._log_debug:
+            logging.debug("Decorator node already exists: %s", annotation_node)
+
+        self._link(file_node, annotation_node, "DECORATED_WITH")
+        if self._log_debug:
+            logging.debug("Edge added: %s -> %s with relation DECORATED_WITH", file_node, annotation_node)
 
     def _add_comment_node(self, file_node: str, comment: Any):
         """
@@ -539,16 +1091,15 @@ class PythonCodeKnowledgeGraph:
             tags = getattr(comment, 'tags', []) or []
 
             try:
-                comment_hash = hash(content)
+                comment_hash = _content_hash(content)
             except Exception:
-                comment_hash = hash("<bad content>")
+                comment_hash = _content_hash("<bad content>")
 
             comment_id = f"Comment: {line_number}_{comment_hash}"
             comment_node = comment_id
 
-            if not self.graph.has_node(comment_node):
-                self.graph.add_node(
-                    comment_node,
+            if comment_node not in self.nodes:
+                self.nodes[comment_node] = _CommentNode(
                     type="comment",
                     comment_type=comment_type,
                     content=content,
@@ -560,10 +1111,12 @@ class PythonCodeKnowledgeGraph:
                 if 'total_comments' not in self.stats or not isinstance(self.stats['total_comments'], int):
                     self.stats['total_comments'] = 0
                 self.stats['total_comments'] += 1
-                logging.debug(f"Comment node added: {comment_node} (line {line_number})")
+                if self._log_debug:
+                    logging.debug("Comment node added: %s (line %s)", comment_node, line_number)
 
-            self.graph.add_edge(file_node, comment_node, relation="HAS_COMMENT")
-            logging.debug(f"Edge added: {file_node} -> {comment_node} with relation HAS_COMMENT")
+            self._link(file_node, comment_node, "HAS_COMMENT")
+            if self._log_debug:
+                logging.debug("Edge added: %s -> %s with relation HAS_COMMENT", file_node, comment_node)
 
         except Exception as e:
             logging.warning(f"Failed to add comment node: {e}")
@@ -584,20 +1137,22 @@ class PythonCodeKnowledgeGraph:
             elif isinstance(log_info, dict):
                 log_message = log_info.get('message', '')
                 log_level = log_info.get('level', 'INFO')
+                if type(log_level) is str:
+                    log_level = sys.intern(log_level)
             else:
                 log_message = str(log_info)
                 log_level = "INFO"
 
             try:
-                log_hash = hash(log_message)
+                log_hash = _content_hash(log_message)
             except Exception:
-                log_hash = hash("<bad message>")
+                log_hash = _content_hash("<bad message>")
 
             log_id = f"Log: {log_hash}"
             log_node = log_id
 
-            if not self.graph.has_node(log_node):
-                self.graph.add_node(
+            if log_node not in self.nodes:
+                self._add_node(
                     log_node,
                     type="log_statement",
                     level=log_level,
@@ -607,10 +1162,12 @@ class PythonCodeKnowledgeGraph:
                 if 'total_logging_statements' not in self.stats or not isinstance(self.stats['total_logging_statements'], int):
                     self.stats['total_logging_statements'] = 0
                 self.stats['total_logging_statements'] += 1
-                logging.debug(f"Log node added: {log_node}")
+                if self._log_debug:
+                    logging.debug("Log node added: %s", log_node)
 
-            self.graph.add_edge(file_node, log_node, relation="USES")
-            logging.debug(f"Edge added: {file_node} -> {log_node} with relation USES")
+            self._link(file_node, log_node, "USES")
+            if self._log_debug:
+                logging.debug("Edge added: %s -> %s with relation USES", file_node, log_node)
 
         except Exception as e:
             logging.warning(f"Failed to add log statement node: {e}")
@@ -634,8 +1191,8 @@ class PythonCodeKnowledgeGraph:
 
             integration_node = f"Integration: {integration_name}"
 
-            if not self.graph.has_node(integration_node):
-                self.graph.add_node(
+            if integration_node not in self.nodes:
+                self._add_node(
                     integration_node,
                     type="api_integration",
                     name=integration_name,
@@ -645,10 +1202,12 @@ class PythonCodeKnowledgeGraph:
                 if 'total_integrations' not in self.stats or not isinstance(self.stats['total_integrations'], int):
                     self.stats['total_integrations'] = 0
                 self.stats['total_integrations'] += 1
-                logging.debug(f"Integration node added: {integration_node}")
+                if self._log_debug:
+                    logging.debug("Integration node added: %s", integration_node)
 
-            self.graph.add_edge(file_node, integration_node, relation="INTEGRATES_WITH")
-            logging.debug(f"Edge added: {file_node} -> {integration_node} with relation INTEGRATES_WITH")
+            self._link(file_node, integration_node, "INTEGRATES_WITH")
+            if self._log_debug:
+                logging.debug("Edge added: %s -> %s with relation INTEGRATES_WITH", file_node, integration_node)
 
         except Exception as e:
             logging.warning(f"Failed to add integration node: {e}")
@@ -663,6 +1222,7 @@ class PythonCodeKnowledgeGraph:
                 logging.warning(f"Version info for {file_node} is not a dict: {version_info}")
                 return
 
+            version_nodes = []
             for version_type, version_data in version_info.items():
                 version_node = f"Version: {version_type}"
 
@@ -675,8 +1235,8 @@ class PythonCodeKnowledgeGraph:
                 elif version_data is not None:
                     constraints = str(version_data)
 
-                if not self.graph.has_node(version_node):
-                    self.graph.add_node(
+                if version_node not in self.nodes:
+                    self._add_node(
                         version_node,
                         type="version",
                         version_type=version_type,
@@ -686,81 +1246,78 @@ class PythonCodeKnowledgeGraph:
                     if 'total_version_constraints' not in self.stats or not isinstance(self.stats['total_version_constraints'], int):
                         self.stats['total_version_constraints'] = 0
                     self.stats['total_version_constraints'] += 1
-                    logging.debug(f"Version node added: {version_node}")
+                    if self._log_debug:
+                        logging.debug("Version node added: %s", version_node)
+
+                version_nodes.append(version_node)
+                if self._log_debug:
+                    logging.debug("Edge added: %s -> %s with relation HAS_VERSION", file_node, version_node)
 
-                self.graph.add_edge(file_node, version_node, relation="HAS_VERSION")
-                logging.debug(f"Edge added: {file_node} -> {version_node} with relation HAS_VERSION")
+            self._link_many(file_node, version_nodes, "HAS_VERSION")
 
         except Exception as e:
             logging.warning(f"Failed to add version info for {file_node}: {e}")
 
-    def _add_localization_usage_node(self, file_node: str, localization: Dict[str, Any]):
-        """Add a localization usage node to the graph."""
-        localization_path = localization.get('path', 'unknown_path')
-        locale = localization.get('locale', 'unknown_locale')
-        localization_node = f"i18n: {os.path.basename(localization_path)}"
-        if not self.graph.has_node(localization_node):
-            self.graph.add_node(
+    def _localization_node_for(self, path: str, locale: str) -> str:
+        """Return the localization node for path, adding it on first sight."""
+        localization_node = f"i18n: {os.path.basename(path)}"
+        if localization_node not in self.nodes:
+            self._add_node(
                 localization_node,
                 type="localization",
-                path=localization_path,
+                path=path,
                 locale=locale,
                 id=localization_node
             )
             self.stats['total_localizations'] += 1
-        self.graph.add_edge(file_node, localization_node, relation="USES")
+        return localization_node
+
+    def _add_localization_usage_node(self, file_node: str, localization: Dict[str, Any]):
+        """Add a localization usage node to the graph."""
+        localization_node = self._localization_node_for(
+            localization.get('path', 'unknown_path'),
+            localization.get('locale', 'unknown_locale')
+        )
+        self._link(file_node, localization_node, "USES")
 
     def _process_build_file(self, file_path: str):
         """Process build configuration files."""
         try:
-            build_type = None
-            if file_path.endswith("setup.py") or file_path.endswith("setup.cfg"):
-                build_type = "setuptools"
-                dependencies = self.dependency_mapper.extract_setup_dependencies(file_path)
-            elif file_path.endswith("requirements.txt"):
-                build_type = "requirements"
-                dependencies = self.dependency_mapper.extract_requirements(file_path)
-            elif file_path.endswith("Pipfile"):
-                build_type = "pipenv"
-                dependencies = self.dependency_mapper.extract_pipfile_dependencies(file_path)
-            elif file_path.endswith("pyproject.toml"):
-                build_type = "poetry"
-                dependencies = self.dependency_mapper.extract_pyproject_dependencies(file_path)
+            build_type, extractor = BUILD_TOOLS.get(os.path.basename(file_path), (None, None))
+            if extractor:
+                dependencies = self._cached_parse(
+                    file_path, extractor, getattr(self.dependency_mapper, extractor)
+                )
             else:
                 dependencies = []
 
             # Add build script node
-            build_node = f"Build: {os.path.relpath(file_path, self.directory)}"
-            if not self.graph.has_node(build_node):
-                self.graph.add_node(
+            relative_path = self._relative_path(file_path)
+            build_node = f"Build: {relative_path}"
+            if build_node not in self.nodes:
+                self._add_node(
                     build_node,
                     type="build_script",
-                    path=os.path.relpath(file_path, self.directory),
+                    path=relative_path,
                     build_tool=build_type,
                     id=build_node
                 )
                 self.stats['total_build_scripts'] += 1
 
-            for dep in dependencies:
-                dep_info = {
-                    'name': dep.name,
-                    'version': dep.version
-                }
-                self._add_dependency_node(build_node, dep_info)
+            self._add_dependency_nodes(build_node, dependencies)
 
         except Exception as e:
             logging.error(f"Error processing build file {file_path}: {str(e)}")
             self.stats['files_with_errors'] += 1
 
-    def _process_config_file(self, file_path: str):
-        """Process configuration files."""
+    def _merge_config_file(self, file_path: str, config_info):
+        """Add the node for a parsed config file (None if it could not be parsed) to the graph."""
         try:
-            relative_path = os.path.relpath(file_path, self.directory)
-            config_info = self.config_parser.parse_config_file(file_path)
+            relative_path = self._relative_path(file_path)
             if config_info:
                 config_node = f"Config: {relative_path}"
-                if not self.graph.has_node(config_node):
-                    self.graph.add_node(
+                if config_node not in self.nodes:
+                    self._add_node(
                         config_node,
                         type="config",
                         path=relative_path,
@@ -770,7 +1327,7 @@ class PythonCodeKnowledgeGraph:
                     self.stats['total_configs'] += 1
                 # Link config to file
                 file_node = f"File: {relative_path}"
-                self.graph.add_edge(file_node, config_node, relation="CONFIGURED_BY")
+                self._add_edge(file_node, config_node, relation="CONFIGURED_BY")
         except AttributeError as ae:
             logging.error(f"AttributeError processing config file {file_path}: {str(ae)}")
             self.stats['files_with_errors'] += 1
@@ -781,62 +1338,96 @@ class PythonCodeKnowledgeGraph:
     def _process_localization_file(self, file_path: str):
         """Process localization files."""
         try:
-            relative_path = os.path.relpath(file_path, self.directory)
+            relative_path = self._relative_path(file_path)
             locale = self.localization_processor.extract_locale(relative_path)
-            localization_node = f"i18n: {os.path.basename(relative_path)}"
-            if not self.graph.has_node(localization_node):
-                self.graph.add_node(
-                    localization_node,
-                    type="localization",
-                    path=relative_path,
-                    locale=locale,
-                    id=localization_node
-                )
-                self.stats['total_localizations'] += 1
+            localization_node = self._localization_node_for(relative_path, locale)
             # Link localization to file
             file_node = f"File: {relative_path}"
-            self.graph.add_edge(file_node, localization_node, relation="CONTAINS")
+            self._add_edge(file_node, localization_node, relation="CONTAINS")
 
         except Exception as e:
             logging.error(f"Error processing localization file {file_path}: {str(e)}")
             self.stats['files_with_errors'] += 1
 
-    def _process_documentation_file(self, file_path: str):
-        """Process documentation files like README.md and API docs."""
+    def _extract_documentation_file(self, file_path: str) -> Dict[str, Any]:
+        """
+        Analyze a documentation file, returning only its section titles so the result pickles small.
+
+        The line and section counts behind get_coverage_threshold are handed
+        back too, and this analyzer's totals left as they were; the merge adds
+        them to the parent's analyzer, whether or not this ran in a worker.
+        """
+        extracted = {}
         try:
-            relative_path = os.path.relpath(file_path, self.directory)
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Large documents are memory-mapped rather than read into a bytes copy
+            content = _read_source(file_path)
+
+            analyzer = self.doc_analyzer
+            total_lines, total_sections = analyzer.total_lines, analyzer.total_sections
+            doc_info = analyzer.analyze_documentation(file_path, content)
+            extracted['counts'] = (analyzer.total_lines - total_lines, analyzer.total_sections - total_sections)
+            analyzer.total_lines, analyzer.total_sections = total_lines, total_sections
+            extracted['sections'] = [section.title for section in doc_info.sections] if doc_info else None
+        except Exception as e:
+            extracted['error'] = f"Error processing documentation file {file_path}: {str(e)}"
+        return extracted
 
-            doc_info = self.doc_analyzer.analyze_documentation(file_path)
-            if doc_info:
+    def _merge_documentation_file(self, file_path: str, extracted: Dict[str, Any]):
+        """Add the node for an analyzed documentation file to the graph."""
+        if 'error' in extracted:
+            logging.error(extracted['error'])
+            self.stats['files_with_errors'] += 1
+            return
+        try:
+            lines, section_count = extracted['counts']
+            self.doc_analyzer.total_lines += lines
+            self.doc_analyzer.total_sections += section_count
+
+            relative_path = self._relative_path(file_path)
+            sections = extracted['sections']
+            if sections is not None:
                 doc_node = f"Documentation: {relative_path}"
-                if not self.graph.has_node(doc_node):
-                    self.graph.add_node(
+                if doc_node not in self.nodes:
+                    self._add_node(
                         doc_node,
                         type="documentation",
                         path=file_path,
-                        sections=[section.title for section in doc_info.sections],
+                        sections=sections,
                         id=doc_node
                     )
                 project_node = "Project: Main"
-                if not self.graph.has_node(project_node):
-                    self.graph.add_node(project_node, type="project", name="Main Project", id=project_node)
-                self.graph.add_edge(project_node, doc_node, relation="HAS_DOCUMENTATION")
+                if project_node not in self.nodes:
+                    self._add_node(project_node, type="project", name="Main Project", id=project_node)
+                self._link(project_node, doc_node, "HAS_DOCUMENTATION")
 
         except Exception as e:
             logging.error(f"Error processing documentation file {file_path}: {str(e)}")
             self.stats['files_with_errors'] += 1
 
-    def _process_generic_file(self, file_path: str):
-        """Process generic files that don't fall into specific categories."""
+    def _extract_generic_file(self, file_path: str) -> Dict[str, Any]:
+        """Detect a generic file's type, encoding and purpose, returning picklable data."""
+        extracted = {}
         try:
-            relative_path = os.path.relpath(file_path, self.directory)
-            file_info = self.file_processor.process_file(file_path)
+            extracted['file_info'] = self.file_processor.process_file(file_path)
+        except AttributeError as ae:
+            extracted['error'] = f"AttributeError processing generic file {file_path}: {str(ae)}"
+        except Exception as e:
+            extracted['error'] = f"Error processing generic file {file_path}: {str(e)}"
+        return extracted
+
+    def _merge_generic_file(self, file_path: str, extracted: Dict[str, Any]):
+        """Add the node for a detected generic file to the graph."""
+        if 'error' in extracted:
+            logging.error(extracted['error'])
+            self.stats['files_with_errors'] += 1
+            return
+        try:
+            relative_path = self._relative_path(file_path)
+            file_info = extracted['file_info']
             if file_info:
                 file_node = f"File: {relative_path}"
-                if not self.graph.has_node(file_node):
-                    self.graph.add_node(
+                if file_node not in self.nodes:
+                    self._add_node(
                         file_node,
                         type=file_info.type.value,
                         encoding=file_info.encoding or 'UTF-8',
@@ -851,63 +1442,52 @@ class PythonCodeKnowledgeGraph:
             logging.error(f"Error processing generic file {file_path}: {str(e)}")
             self.stats['files_with_errors'] += 1
 
+    def _build_metadata(self) -> Dict[str, Any]:
+        """Collect the statistics and project information saved alongside the graph."""
+        return {
+            "stats": {
+                "total_files": self.total_files,
+                "files_processed": self.files_processed,
+                "files_with_errors": self.stats['files_with_errors'],
+                "total_classes": self.stats['total_classes'],
+                "total_functions": self.stats['total_functions'],
+                "total_variables": self.stats['total_variables'],
+                "total_modules": len(self.stats['total_modules']),
+                "total_imports": self.stats['total_imports'],
+                "total_dependencies": len(self.stats['total_dependencies']),
+                "total_annotations": self.stats['total_annotations'],
+                "total_logging_statements": self.stats['total_logging_statements'],
+                "total_comments": self.stats['total_comments'],
+                "total_configs": self.stats['total_configs'],
+                "total_integrations": self.stats['total_integrations'],
+                "total_localizations": self.stats['total_localizations'],
+                "total_build_scripts": self.stats['total_build_scripts'],
+                "total_version_constraints": self.stats['total_version_constraints']
+            },
+            "build_info": {
+                "python_version": self.version_analyzer.extract_python_version(),
+                "build_tool": self.build_extractor.get_build_tool(),
+                "main_module": self.code_extractor.get_main_module()
+            },
+            "documentation": {
+                "readme_path": "README.md",
+                "api_docs": "docs/api.md",
+                "coverage_threshold": self.doc_analyzer.get_coverage_threshold()
+            },
+            "analysis_timestamp": datetime.now().isoformat(),
+            "analyzed_directory": self.directory,
+            "modules": list(self.stats['total_modules']),
+            "dependencies": list(self.stats['total_dependencies'])
+        }
+
     def save_graph(self, output_path: str):
         """Save the knowledge graph to a JSON file."""
         try:
-            # Convert graph to JSON format with explicit edges keyword to suppress FutureWarning
-            data = json_graph.node_link_data(self.graph, edges="links")
-
-            # Prepare metadata
-            metadata = {
-                "stats": {
-                    "total_files": self.total_files,
-                    "files_processed": self.files_processed,
-                    "files_with_errors": self.stats['files_with_errors'],
-                    "total_classes": self.stats['total_classes'],
-                    "total_functions": self.stats['total_functions'],
-                    "total_variables": self.stats['total_variables'],
-                    "total_modules": len(self.stats['total_modules']),
-                    "total_imports": self.stats['total_imports'],
-                    "total_dependencies": len(self.stats['total_dependencies']),
-                    "total_annotations": len(self.stats['total_annotations']),
-                    "total_logging_statements": self.stats['total_logging_statements'],
-                    "total_comments": self.stats['total_comments'],
-                    "total_configs": self.stats['total_configs'],
-                    "total_integrations": self.stats['total_integrations'],
-                    "total_localizations": self.stats['total_localizations'],
-                    "total_build_scripts": self.stats['total_build_scripts'],
-                    "total_version_constraints": self.stats['total_version_constraints']
-                },
-                "build_info": {
-                    "python_version": self.version_analyzer.extract_python_version(),
-                    "build_tool": self.build_extractor.get_build_tool(),
-                    "main_module": self.code_extractor.get_main_module()
-                },
-                "documentation": {
-                    "readme_path": "README.md",
-                    "api_docs": "docs/api.md",
-                    "coverage_threshold": self.doc_analyzer.get_coverage_threshold()
-                },
-                "analysis_timestamp": datetime.now().isoformat(),
-                "analyzed_directory": self.directory,
-                "modules": list(self.stats['total_modules']),
-                "dependencies": list(self.stats['total_dependencies'])
-            }
+            metadata = self._build_metadata()
 
-            # Combine data and metadata
-            output_data = {
-                "graph": {
-                    "directed": data['directed'],
-                    "multigraph": data['multigraph'],
-                    "nodes": data['nodes'],
-                    "links": data['links']
-                },
-                "metadata": metadata
-            }
-
-            # Save to file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, indent=2)
+            # Stream the node-link graph and metadata to file
+            with open(output_path, 'wb') as f:
+                self._write_graph_json(f, metadata)
 
             # Log statistics
             logging.info(f"\nAnalysis Statistics:")
@@ -921,6 +1501,34 @@ class PythonCodeKnowledgeGraph:
         except Exception as e:
             logging.error(f"Error saving graph: {str(e)}")
 
+    def graph_document(self) -> Dict[str, Any]:
+        """Build the in-memory document that save_graph writes out as JSON."""
+        return {
+            "graph": {
+                "directed": True,
+                "multigraph": False,
+                "nodes": list(self._iter_node_records()),
+                "links": list(self._iter_link_records())
+            },
+            "metadata": self._build_metadata()
+        }
+
+    def graph_view(self) -> Dict[str, Any]:
+        """
+        Return the graph_document layout with the node and link lists replaced
+        by views that build their records on each pass, for consumers that only
+        iterate over them.
+        """
+        return {
+            "graph": {
+                "directed": True,
+                "multigraph": False,
+                "nodes": _RecordView(self._iter_node_records),
+                "links": _RecordView(self._iter_link_records)
+            },
+            "metadata": self._build_metadata()
+        }
+
     def generate_example_output_structure(self):
         """Generate an example structure for reference."""
         example_output = {
@@ -976,6 +1584,11 @@ class PythonCodeKnowledgeGraph:
         """Visualize the knowledge graph."""
         try:
             import matplotlib.pyplot as plt
+            import networkx as nx
+            import numpy as np
+            from matplotlib.colors import to_rgba_array
+
+            graph = self.to_networkx()
 
             # Create color map for different node types
             color_map = {
@@ -999,21 +1612,36 @@ class PythonCodeKnowledgeGraph:
                 "config": "#FFE4B5",         # Moccasin
             }
 
-            # Set node colors
-            node_colors = [
-                color_map.get(self.graph.nodes[node].get("type", "file"), "lightgray")
-                for node in self.graph.nodes()
-            ]
+            # Set node colors, reading each node's type in a single pass over the node data.
+            # Each type's color is converted to RGBA once and indexed per node, so
+            # matplotlib does not have to parse a color string for every node.
+            palette = to_rgba_array(list(color_map.values()) + ["lightgray"])
+            type_index = {node_type: i for i, node_type in enumerate(color_map)}
+            unknown_index = len(color_map)
+            node_colors = palette[np.fromiter(
+                (type_index.get(node_type, unknown_index)
+                 for _, node_type in graph.nodes(data="type", default="file")),
+                dtype=np.intp,
+                count=graph.number_of_nodes()
+            )]
 
             # Create figure and axis explicitly
             fig, ax = plt.subplots(figsize=(20, 15))
 
-            # Calculate layout
-            pos = nx.spring_layout(self.graph, k=1.5, iterations=50)
+            # Calculate layout. Each spring_layout iteration is quadratic in the
+            # node count, so large graphs use graphviz's sfdp when pygraphviz is
+            # installed and a shorter spring layout otherwise.
+            if graph.number_of_nodes() > self.LARGE_LAYOUT_NODES:
+                try:
+                    pos = nx.nx_agraph.graphviz_layout(graph, prog="sfdp")
+                except (ImportError, ValueError, OSError):
+                    pos = nx.spring_layout(graph, k=1.5, iterations=20)
+            else:
+                pos = nx.spring_layout(graph, k=1.5, iterations=50)
 
             # Draw the graph
             nx.draw(
-                self.graph,
+                graph,
                 pos,
                 ax=ax,
                 with_labels=True,
@@ -1076,19 +1704,17 @@ if __name__ == "__main__":
         output_file = os.path.join(compression_dir, "python_code_knowledge_graph.json")
 
         # Create and analyze the codebase
-        graph_generator = PythonCodeKnowledgeGraph(directory=codebase_dir)
+        graph_generator = PythonCodeKnowledgeGraph(
+            directory=codebase_dir, parse_cache=_default_parse_cache_path()
+        )
         graph_generator.analyze_codebase()
 
         graph_generator.save_graph(output_file)
 
-        # Wait until the file is confirmed to exist
-        import time
-        for _ in range(10):  # Retry for up to 10 seconds
-            if os.path.exists(output_file):
-                break
-            time.sleep(1)
-        else:
-            raise FileNotFoundError(f"{output_file} was not created in time.")
+        # save_graph writes synchronously but logs failures instead of raising,
+        # so a missing file means the save failed
+        if not os.path.exists(output_file):
+            raise FileNotFoundError(f"{output_file} was not created.")
 
         # Ask user if they want to visualize the graph
         visualize = input("\nWould you like to visualize the knowledge graph? (y/n): ").strip().lower()
@@ -1096,21 +1722,21 @@ if __name__ == "__main__":
             print("Generating visualization...")
             graph_generator.visualize_graph()
 
-        # Call the compression script
+        # Run the compression script in-process on the graph we already hold,
+        # rather than starting a new interpreter to re-read the JSON file
         try:
-            import subprocess
-
-            compression_script = os.path.join(compression_dir, 'compression.py')  
+            compression_script = os.path.join(compression_dir, 'compression.py')
+            if not os.path.exists(compression_script):
+                raise FileNotFoundError(compression_script)
 
-            # Output file path is already absolute from earlier change
-            output_file_path = output_file
+            spec = importlib.util.spec_from_file_location("compression", compression_script)
+            compression = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(compression)
 
-            subprocess.run(['python', compression_script, output_file_path], check=True)
-            print(f"Compression script executed successfully on {output_file_path}")
+            compression.compress_knowledge_graph(graph_generator.graph_view())
+            print(f"Compression script executed successfully on {output_file}")
         except FileNotFoundError:
             print(f"Error: Compression script not found at {compression_script}")
-        except subprocess.CalledProcessError as e:
-            print(f"Error executing compression script: {e}")
         except Exception as e:
             print(f"An unexpected error occurred: {e}")
 
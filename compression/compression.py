@@ -1,20 +1,31 @@
 import sys
+import gzip
 import json
+import mmap
 import os
 from collections import defaultdict
 
-# Ensure a file path is provided
-if len(sys.argv) != 2:
-    raise ValueError("Please provide the path to 'python_code_knowledge_graph.json' as an argument.")
-
-input_file = sys.argv[1]
-
-# Load the knowledge graph from the JSON file
-if not os.path.exists(input_file):
-    raise FileNotFoundError(f"File not found: {input_file}")
-
-with open(input_file, "r") as f:
-    knowledge_graph = json.load(f)
+# orjson is optional; it parses the graph JSON about twice as fast as json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Function to load the knowledge graph saved by the analyzer
+def load_knowledge_graph(input_file):
+    if not os.path.exists(input_file):
+        raise FileNotFoundError(f"File not found: {input_file}")
+
+    if orjson is not None and os.path.getsize(input_file) > 0:
+        # Parse straight from a memory map, without reading the file into a bytes copy first
+        with open(input_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            try:
+                return orjson.loads(memoryview(mm))
+            except orjson.JSONDecodeError:
+                # e.g. NaN, which json accepts but orjson rejects
+                pass
+    with open(input_file, "r") as f:
+        return json.load(f)
 
 # Function to generate abbreviations for all unique terms
 def generate_abbreviations(knowledge_graph):
@@ -34,12 +45,7 @@ def generate_abbreviations(knowledge_graph):
         unique_terms.add(link["target"])
 
     # Generate abbreviations
-    abbreviations = {}
-    idx = 1
-    for term in sorted(unique_terms):
-        abbreviations[term] = f"T{idx}"
-        idx += 1
-    return abbreviations
+    return {term: f"T{idx}" for idx, term in enumerate(sorted(unique_terms), 1)}
 
 # Helper function to collect terms recursively
 def collect_terms(value, unique_terms):
@@ -53,10 +59,12 @@ def collect_terms(value, unique_terms):
     else:
         unique_terms.add(str(value))
 
-# Function to serialize the knowledge graph using abbreviations
-def serialize_knowledge_graph(knowledge_graph, abbreviations):
-    serialized_data = []
+# Function to serialize the knowledge graph using abbreviations.
+# Lines are written to the binary file `out` as they are built, rather than
+# joined into one string first, so the output is never held in memory whole.
+def serialize_knowledge_graph(knowledge_graph, abbreviations, out):
     graph = knowledge_graph["graph"]
+    write = out.write
 
     # Instructions for LLM
     instructions = (
@@ -75,59 +83,96 @@ def serialize_knowledge_graph(knowledge_graph, abbreviations):
         "#   - Dicts: {KEY1:VAL1,KEY2:VAL2,...}\n"
         "# Codebook:"
     )
-    serialized_data.append(instructions)
+    write(instructions.encode("utf-8"))
 
-    # Include the codebook
+    # Include the codebook. Each line after the instructions is written with
+    # a leading newline, so the file does not end in one
     for term, abbr in sorted(abbreviations.items(), key=lambda x: x[1]):
-        serialized_data.append(f"# {abbr}:{term}")
+        write(f"\n# {abbr}:{term}".encode("utf-8"))
 
     # Serialize nodes
     for node in graph["nodes"]:
         node_id = abbreviations[node["id"]]
-        attributes = []
-        for key, value in node.items():
-            if key != "id":
-                key_abbr = abbreviations[key]
-                value_abbr = abbreviate_value(value, abbreviations)
-                attributes.append(f"{key_abbr}={value_abbr}")
-        attr_str = ';'.join(attributes)
-        serialized_data.append(f"N|{node_id}|{attr_str}")
+        attr_str = ';'.join([
+            f"{abbreviations[key]}={abbreviate_value(value, abbreviations)}"
+            for key, value in node.items() if key != "id"
+        ])
+        write(f"\nN|{node_id}|{attr_str}".encode("utf-8"))
 
     # Serialize links
     for link in graph["links"]:
         source_abbr = abbreviations[link["source"]]
         relation_abbr = abbreviations[link["relation"]]
         target_abbr = abbreviations[link["target"]]
-        serialized_data.append(f"L|{source_abbr}|{relation_abbr}|{target_abbr}")
-
-    return '\n'.join(serialized_data)
+        write(f"\nL|{source_abbr}|{relation_abbr}|{target_abbr}".encode("utf-8"))
 
 # Helper function to abbreviate values recursively
 def abbreviate_value(value, abbreviations):
+    # Most values are plain strings, so check for those first
+    if isinstance(value, str):
+        return abbreviations.get(value, value)
     if isinstance(value, list):
         items = [abbreviate_value(item, abbreviations) for item in value]
         return f"[{','.join(items)}]"
     elif isinstance(value, dict):
-        items = []
-        for k, v in value.items():
-            k_abbr = abbreviations[str(k)]
-            v_abbr = abbreviate_value(v, abbreviations)
-            items.append(f"{k_abbr}:{v_abbr}")
+        items = [f"{abbreviations[str(k)]}:{abbreviate_value(v, abbreviations)}" for k, v in value.items()]
         return f"{{{','.join(items)}}}"
     else:
-        return abbreviations.get(str(value), str(value))
+        value = str(value)
+        return abbreviations.get(value, value)
+
+# Function to gzip the knowledge graph as compact JSON. The result is not
+# readable by an LLM the way the abbreviated text is, but it is much cheaper
+# to produce and usually smaller.
+def gzip_knowledge_graph(knowledge_graph):
+    # default=list turns record views passed in place of lists into lists
+    if orjson is not None:
+        data = orjson.dumps(knowledge_graph, default=list)
+    else:
+        data = json.dumps(knowledge_graph, separators=(",", ":"), default=list).encode("utf-8")
+    return gzip.compress(data, compresslevel=6)
+
+# Output formats: "txt" is the abbreviated text for LLMs, "gz" is gzipped JSON
+OUTPUT_FORMATS = ("txt", "gz")
+
+# Function to compress an in-memory knowledge graph and write it to disk.
+# The graph's "nodes" and "links" only need to be iterable more than once,
+# so the analyzer can pass views that build each record as it is read.
+def compress_knowledge_graph(knowledge_graph, output_format="txt"):
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format: {output_format}")
+
+    # Ensure the "compression" directory exists
+    output_dir = "compression"
+    os.makedirs(output_dir, exist_ok=True)  # Create the directory if it doesn't exist
+
+    if output_format == "gz":
+        output_file = os.path.join(output_dir, "compressed_knowledge_graph.json.gz")
+        with open(output_file, "wb") as f:
+            f.write(gzip_knowledge_graph(knowledge_graph))
+        return output_file
+
+    # Generate abbreviations
+    abbreviations = generate_abbreviations(knowledge_graph)
+
+    # Serialize the knowledge graph into the file in the "compression" directory
+    output_file = os.path.join(output_dir, "compressed_knowledge_graph.txt")
+    with open(output_file, "wb", buffering=1 << 20) as f:
+        serialize_knowledge_graph(knowledge_graph, abbreviations, f)
+    return output_file
 
-# Generate abbreviations
-abbreviations = generate_abbreviations(knowledge_graph)
+def main(argv):
+    # An optional trailing --format=txt|gz picks the output format
+    args = argv[1:]
+    output_format = "txt"
+    if args and args[-1].startswith("--format="):
+        output_format = args.pop()[len("--format="):]
 
-# Serialize the knowledge graph
-compressed_data = serialize_knowledge_graph(knowledge_graph, abbreviations)
+    # Ensure a file path is provided
+    if len(args) != 1:
+        raise ValueError("Please provide the path to 'python_code_knowledge_graph.json' as an argument.")
 
-# Ensure the "compression" directory exists
-output_dir = "compression"
-os.makedirs(output_dir, exist_ok=True)  # Create the directory if it doesn't exist
+    compress_knowledge_graph(load_knowledge_graph(args[0]), output_format)
 
-# Write the compressed data to the file in the "compression" directory
-output_file = os.path.join(output_dir, "compressed_knowledge_graph.txt")
-with open(output_file, "w") as f:
-    f.write(compressed_data)
+if __name__ == "__main__":
+    main(sys.argv)
@@ -5,9 +5,19 @@ import os
 from typing import List, Dict, Any
 import yaml
 import configparser
-import toml
 import logging
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+
+# libyaml's C loader is about ten times faster, but PyYAML can be built without it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 class BuildConfigExtractor:
     """
     Processes build configuration files to extract build and installation commands,
@@ -16,17 +26,26 @@ class BuildConfigExtractor:
 
     def __init__(self):
         # Initialize any required variables or data structures
+        # Each literal runs to the first closing bracket, so a negated class
+        # matches the same text as a lazy '.*?' without retrying at every character
         self.setup_py_patterns = {
-            'install_requires': re.compile(r'install_requires\s*=\s*\[(.*?)\]', re.DOTALL),
-            'packages': re.compile(r'packages\s*=\s*\[(.*?)\]', re.DOTALL),
-            'entry_points': re.compile(r'entry_points\s*=\s*\{(.*?)\}', re.DOTALL),
+            'install_requires': re.compile(r'install_requires\s*=\s*\[([^\]]*)\]'),
+            'packages': re.compile(r'packages\s*=\s*\[([^\]]*)\]'),
+            'entry_points': re.compile(r'entry_points\s*=\s*\{([^}]*)\}'),
         }
         self.dockerfile_patterns = {
             'commands': re.compile(r'^\s*(RUN|CMD|ENTRYPOINT|ENV|EXPOSE|VOLUME|WORKDIR)\s+(.*)', re.MULTILINE),
         }
+        self.list_separator_pattern = re.compile(r',\s*')
         self.makefile_patterns = {
-            'target': re.compile(r'^([a-zA-Z0-9_-]+)\s*:\s*(.*)'),
+            # A target header or a tab-indented recipe line; [^\S\n] keeps the
+            # whitespace from running on into the next line
+            'line': re.compile(r'^(?:([a-zA-Z0-9_-]+)[^\S\n]*:|\t(.*))', re.MULTILINE),
+            # Line boundaries other than '\n' that splitlines() also breaks at
+            'line_ends': re.compile(r'[\r\v\f\x1c-\x1e\x85\u2028\u2029]'),
         }
+        # Detected on the first get_build_tool call
+        self._build_tool = None
         logging.basicConfig(level=logging.INFO)
 
     def extract_setup_py(self, file_content: str) -> Dict[str, Any]:
@@ -83,15 +102,18 @@ class BuildConfigExtractor:
         Extracts targets and associated commands from Makefile.
         """
         targets = {}
-        lines = file_content.splitlines()
         current_target = None
-        for line in lines:
-            target_match = self.makefile_patterns['target'].match(line)
-            if target_match:
-                current_target = target_match.group(1)
+        # The line pattern only knows '\n', so files with any other line ends
+        # (CRLF included) are split the way splitlines() would first
+        if self.makefile_patterns['line_ends'].search(file_content):
+            file_content = '\n'.join(file_content.splitlines())
+        for match in self.makefile_patterns['line'].finditer(file_content):
+            target, recipe = match.groups()
+            if target:
+                current_target = target
                 targets[current_target] = []
-            elif current_target and line.startswith('\t'):
-                targets[current_target].append(line.strip())
+            elif current_target:
+                targets[current_target].append(recipe.strip())
         return targets
 
     def extract_yaml_config(self, file_content: str) -> Dict[str, Any]:
@@ -99,7 +121,7 @@ class BuildConfigExtractor:
         Extracts configurations from YAML files (e.g., CI/CD pipeline configs).
         """
         try:
-            config = yaml.safe_load(file_content)
+            config = yaml.load(file_content, Loader=SafeLoader)
             return config
         except yaml.YAMLError as e:
             logging.error(f"YAML parsing error: {e}")
@@ -110,9 +132,9 @@ class BuildConfigExtractor:
         Extracts configurations from pyproject.toml files.
         """
         try:
-            config = toml.loads(file_content)
+            config = tomllib.loads(file_content)
             return config
-        except toml.TomlDecodeError as e:
+        except tomllib.TOMLDecodeError as e:
             logging.error(f"TOML parsing error: {e}")
             return {}
 
@@ -150,7 +172,7 @@ class BuildConfigExtractor:
         Cleans and splits a string representation of a list into an actual list.
         """
         # Remove quotes and split by comma
-        items = re.split(r',\s*', list_string.strip('[]()'))
+        items = self.list_separator_pattern.split(list_string.strip('[]()'))
         return [item.strip('\'"') for item in items if item]
 
     def extract_pipfile_dependencies(self, file_path: str) -> List[Dict[str, Any]]:
@@ -158,9 +180,8 @@ class BuildConfigExtractor:
         Extracts dependencies from Pipfile.
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            config = toml.loads(content)
+            with open(file_path, 'rb') as f:
+                config = tomllib.load(f)
             dependencies = []
             for section in ['packages', 'dev-packages']:
                 if section in config:
@@ -218,9 +239,8 @@ class BuildConfigExtractor:
         Extracts dependencies from pyproject.toml (e.g., Poetry).
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            config = toml.loads(content)
+            with open(file_path, 'rb') as f:
+                config = tomllib.load(f)
             dependencies = []
             if 'tool' in config and 'poetry' in config['tool']:
                 poetry_config = config['tool']['poetry']
@@ -240,7 +260,13 @@ class BuildConfigExtractor:
         """
         Returns the build tool used by the project based on the configuration files.
         The method looks at setup.py, Pipfile, pyproject.toml, etc.
+        The result is cached, so the files are only checked once per extractor.
         """
+        if self._build_tool is None:
+            self._build_tool = self._detect_build_tool()
+        return self._build_tool
+
+    def _detect_build_tool(self) -> str:
         if os.path.exists('pyproject.toml'):
             return 'poetry'
         elif os.path.exists('Pipfile'):
@@ -1,16 +1,21 @@
 import re
 import ast
-from typing import List, Dict, Optional, Any, Set
+from bisect import bisect_left
+from typing import List, Dict, Optional, Any, Set, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 import logging
 
-@dataclass
+# Extraction creates one of these per parameter, function and class, so they
+# are slotted to keep each instance small. Parameters are also frozen, since
+# the parsed lists below share them between every function with the signature
+@dataclass(slots=True, frozen=True)
 class Parameter:
     name: str
     type_hint: Optional[str] = None
     default_value: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class FunctionInfo:
     name: str
     parameters: List[Parameter]
@@ -20,7 +25,7 @@ class FunctionInfo:
     is_generator: bool = False
     docstring: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class ClassInfo:
     name: str
     bases: List[str]
@@ -28,132 +33,177 @@ class ClassInfo:
     methods: List[FunctionInfo]
     docstring: Optional[str] = None
 
+# Signatures repeat a lot ('self', 'self, other', ''), so parsed parameter
+# lists are cached. The tuple keeps the cached list itself from changing and
+# Parameter is frozen, so the instances shared through it cannot change either
+@lru_cache(maxsize=4096)
+def _parse_parameter_list(params_str: str) -> Tuple[Parameter, ...]:
+    """Parse function parameters with their type hints and default values."""
+    if not params_str.strip():
+        return ()
+
+    parameters = []
+
+    # Handle nested parentheses in default values
+    depth = 0
+    current = []
+    params = []
+
+    for char in params_str:
+        if char == '(' or char == '[' or char == '{':
+            depth += 1
+        elif char == ')' or char == ']' or char == '}':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            params.append(''.join(current).strip())
+            current = []
+            continue
+        current.append(char)
+
+    if current:
+        params.append(''.join(current).strip())
+
+    for param in params:
+        param = param.strip()
+        if not param:
+            continue
+
+        # Handle type hints and default values
+        parts = param.split(':')
+        name = parts[0].strip()
+        type_hint = None
+        default_value = None
+
+        if len(parts) > 1:
+            # Handle default values in type-hinted parameters
+            type_parts = parts[1].split('=')
+            type_hint = type_parts[0].strip()
+            if len(type_parts) > 1:
+                default_value = type_parts[1].strip()
+        else:
+            # Handle default values in non-type-hinted parameters
+            if '=' in name:
+                name, default_value = map(str.strip, name.split('=', 1))
+
+        parameters.append(Parameter(
+            name=name,
+            type_hint=type_hint,
+            default_value=default_value
+        ))
+
+    return tuple(parameters)
+
 class CodeIdentifierExtractor:
+    # Stripped lines that can hold a decorator, a def or a class
+    DEFINITION_STARTS = ('@', 'def', 'async', 'class')
+
     def __init__(self):
         self.class_pattern = re.compile(r'class\s+(\w+)\s*(?:\((.*?)\))?:')
         self.function_pattern = re.compile(r'(?:async\s+)?def\s+(\w+)\s*\((.*?)\)\s*(?:->\s*([^:]+))?:')
         self.decorator_pattern = re.compile(r'@(\w+(?:\.\w+)*(?:\(.*?\))?)')
-        self.variable_pattern = re.compile(r'(\w+)\s*(?::\s*([^=]+))?\s*=\s*([^#\n]+)')
+        # The lookbehind keeps the scan from retrying at every position inside an
+        # identifier; a match can only ever start at the beginning of a word
+        self.variable_pattern = re.compile(r'(?<!\w)(\w+)\s*(?::\s*([^=]+))?\s*=\s*([^#\n]+)')
         self.constant_pattern = re.compile(r'([A-Z_][A-Z0-9_]*)\s*=\s*([^#\n]+)')
         
+    def extract_definitions(self, content: str) -> Tuple[List[ClassInfo], List[FunctionInfo]]:
+        """
+        Extract class and function definitions in one pass over the lines.
+
+        Every def line (methods included) is parsed once; a class's methods
+        are the defs that fall inside its body, so class bodies are not
+        re-split and re-scanned. Only lines that can open a definition or a
+        decorator are visited by the scanners below.
+        """
+        lines = content.splitlines()
+        stripped = [line.strip() for line in lines]
+        starts = [i for i, line in enumerate(stripped) if line.startswith(self.DEFINITION_STARTS)]
+        functions, def_lines = self._scan_functions(stripped, starts)
+        classes = []
+        for class_name, bases, decorators, body_start, body_end in self._scan_classes(lines, stripped, starts):
+            first = bisect_left(def_lines, body_start)
+            last = bisect_left(def_lines, body_end, first)
+            classes.append(ClassInfo(
+                name=class_name,
+                bases=bases,
+                decorators=decorators,
+                methods=functions[first:last]
+            ))
+        return classes, functions
+
     def extract_classes(self, content: str) -> List[ClassInfo]:
         """Extract class definitions and their methods."""
-        classes = []
-        lines = content.splitlines()
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            # Collect decorators
-            decorators = []
-            while line.startswith('@'):
-                decorator_match = self.decorator_pattern.match(line)
-                if decorator_match:
-                    decorators.append(decorator_match.group(1))
-                i += 1
-                if i >= len(lines):
-                    break
-                line = lines[i].strip()
-            
+        return self.extract_definitions(content)[0]
+
+    def extract_functions(self, content: str) -> List[FunctionInfo]:
+        """Extract function definitions."""
+        return self.extract_definitions(content)[1]
+
+    def _collect_decorators(self, stripped: List[str], i: int) -> Tuple[List[str], int]:
+        """Collect the decorators starting at line i; returns them and the index of the line after."""
+        decorators = []
+        line = stripped[i]
+        while line.startswith('@'):
+            decorator_match = self.decorator_pattern.match(line)
+            if decorator_match:
+                decorators.append(decorator_match.group(1))
+            i += 1
+            if i >= len(stripped):
+                # Leave i on the last decorator, which the caller then skips
+                return decorators, i - 1
+            line = stripped[i]
+        return decorators, i
+
+    def _scan_classes(self, lines: List[str], stripped: List[str], starts: List[int]):
+        """Yield (name, bases, decorators, body_start, body_end) for each class."""
+        # A class body ends at the first non-blank line that is not indented
+        unindented = [
+            i for i, line in enumerate(lines)
+            if stripped[i] and not line.startswith((' ', '\t'))
+        ]
+        resume = 0
+        for i in starts:
+            if i < resume:
+                continue
+            decorators, i = self._collect_decorators(stripped, i)
+
             # Match class definition
-            class_match = self.class_pattern.match(line)
+            class_match = self.class_pattern.match(stripped[i])
             if class_match:
                 class_name = class_match.group(1)
                 bases = []
                 if class_match.group(2):
                     bases = [b.strip() for b in class_match.group(2).split(',')]
-                
-                # Extract class methods
-                methods = []
-                i += 1
-                while i < len(lines) and (not lines[i].strip() or lines[i].startswith(' ') or lines[i].startswith('\t')):
-                    method_lines = []
-                    while i < len(lines) and (not lines[i].strip() or lines[i].startswith(' ') or lines[i].startswith('\t')):
-                        method_lines.append(lines[i])
-                        i += 1
-                    if method_lines:
-                        method_content = '\n'.join(method_lines)
-                        methods.extend(self._extract_methods(method_content))
-                
-                classes.append(ClassInfo(
-                    name=class_name,
-                    bases=bases,
-                    decorators=decorators,
-                    methods=methods
-                ))
-            i += 1
-        return classes
 
-    def _extract_methods(self, content: str) -> List[FunctionInfo]:
-        """Extract method definitions from class content."""
-        methods = []
-        lines = content.splitlines()
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            # Collect decorators
-            decorators = []
-            while line.startswith('@'):
-                decorator_match = self.decorator_pattern.match(line)
-                if decorator_match:
-                    decorators.append(decorator_match.group(1))
-                i += 1
-                if i >= len(lines):
-                    break
-                line = lines[i].strip()
-            
-            # Match function definition
-            func_match = self.function_pattern.match(line)
-            if func_match:
-                is_async = line.startswith('async')
-                name = func_match.group(1)
-                params_str = func_match.group(2)
-                return_type = func_match.group(3)
-                
-                # Parse parameters
-                parameters = self._parse_parameters(params_str)
-                
-                methods.append(FunctionInfo(
-                    name=name,
-                    parameters=parameters,
-                    return_type=return_type.strip() if return_type else None,
-                    decorators=decorators,
-                    is_async=is_async
-                ))
-            i += 1
-        return methods
+                body_start = i + 1
+                end = bisect_left(unindented, body_start)
+                i = unindented[end] if end < len(unindented) else len(lines)
+                yield class_name, bases, decorators, body_start, i
+            # The line that ends a class body is not itself checked for a class
+            resume = i + 1
 
-    def extract_functions(self, content: str) -> List[FunctionInfo]:
-        """Extract function definitions."""
+    def _scan_functions(self, stripped: List[str], starts: List[int]) -> Tuple[List[FunctionInfo], List[int]]:
+        """Parse every def line; returns the functions and the line index of each."""
         functions = []
-        lines = content.splitlines()
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            # Collect decorators
-            decorators = []
-            while line.startswith('@'):
-                decorator_match = self.decorator_pattern.match(line)
-                if decorator_match:
-                    decorators.append(decorator_match.group(1))
-                i += 1
-                if i >= len(lines):
-                    break
-                line = lines[i].strip()
-            
+        def_lines = []
+        resume = 0
+        for i in starts:
+            if i < resume:
+                continue
+            decorators, i = self._collect_decorators(stripped, i)
+            line = stripped[i]
+
             # Match function definition
             func_match = self.function_pattern.match(line)
-            if func_match and not line.startswith(' ') and not line.startswith('\t'):
+            if func_match:
                 is_async = line.startswith('async')
                 name = func_match.group(1)
                 params_str = func_match.group(2)
                 return_type = func_match.group(3)
-                
+
                 # Parse parameters
                 parameters = self._parse_parameters(params_str)
-                
+
                 functions.append(FunctionInfo(
                     name=name,
                     parameters=parameters,
@@ -161,63 +211,13 @@ class CodeIdentifierExtractor:
                     decorators=decorators,
                     is_async=is_async
                 ))
-            i += 1
-        return functions
+                def_lines.append(i)
+            resume = i + 1
+        return functions, def_lines
 
     def _parse_parameters(self, params_str: str) -> List[Parameter]:
         """Parse function parameters with their type hints and default values."""
-        parameters = []
-        if not params_str.strip():
-            return parameters
-            
-        # Handle nested parentheses in default values
-        depth = 0
-        current = []
-        params = []
-        
-        for char in params_str:
-            if char == '(' or char == '[' or char == '{':
-                depth += 1
-            elif char == ')' or char == ']' or char == '}':
-                depth -= 1
-            elif char == ',' and depth == 0:
-                params.append(''.join(current).strip())
-                current = []
-                continue
-            current.append(char)
-        
-        if current:
-            params.append(''.join(current).strip())
-        
-        for param in params:
-            param = param.strip()
-            if not param:
-                continue
-                
-            # Handle type hints and default values
-            parts = param.split(':')
-            name = parts[0].strip()
-            type_hint = None
-            default_value = None
-            
-            if len(parts) > 1:
-                # Handle default values in type-hinted parameters
-                type_parts = parts[1].split('=')
-                type_hint = type_parts[0].strip()
-                if len(type_parts) > 1:
-                    default_value = type_parts[1].strip()
-            else:
-                # Handle default values in non-type-hinted parameters
-                if '=' in name:
-                    name, default_value = map(str.strip, name.split('=', 1))
-            
-            parameters.append(Parameter(
-                name=name,
-                type_hint=type_hint,
-                default_value=default_value
-            ))
-            
-        return parameters
+        return list(_parse_parameter_list(params_str))
 
     def extract_variables(self, content: str) -> List[Dict[str, Any]]:
         """Extract variable definitions with their type hints and values."""
@@ -13,6 +13,9 @@ class CommentType(Enum):
 
 
 class CommentInfo:
+    # One instance per comment line, so no per-instance __dict__
+    __slots__ = ('content', 'line_number', 'type', 'associated_element', 'tags')
+
     def __init__(
         self,
         content: str,
@@ -37,6 +40,7 @@ class CommentProcessor:
             r'^[ \t]*("""|\'\'\')(?:.*?)(\1)', re.DOTALL | re.MULTILINE
         )
         self.def_class_pattern = re.compile(r'^[ \t]*(def|class)\s+(\w+)\s*[\(:]?')
+        self.docstring_start_pattern = re.compile(r'^[ \t]*("""|\'\'\')')
 
     def extract_comments(self, content: str) -> List[CommentInfo]:
         comments = []
@@ -48,13 +52,15 @@ class CommentProcessor:
         associated_element = None
 
         for idx, line in enumerate(lines):
-            line_number = idx + 1
-            stripped_line = line.strip()
-
-            # Check for docstring start
+            # Check for docstring start; only lines opening with a triple quote can match
             if not in_docstring:
-                docstring_match = re.match(
-                    r'^[ \t]*("""|\'\'\')', line
+                # Most lines hold neither a comment nor a docstring
+                if '#' not in line and '"""' not in line and "'''" not in line:
+                    continue
+                line_number = idx + 1
+                docstring_match = (
+                    self.docstring_start_pattern.match(line)
+                    if line.lstrip(' \t').startswith(('"""', "'''")) else None
                 )
                 if docstring_match:
                     in_docstring = True
@@ -70,7 +76,8 @@ class CommentProcessor:
                     continue
             else:
                 docstring_content += '\n' + line
-                if docstring_delimiter in stripped_line:
+                # Stripping the line cannot remove a delimiter, so look in the line itself
+                if docstring_delimiter in line:
                     in_docstring = False
                     comment = CommentInfo(
                         content=docstring_content.strip(),
@@ -84,18 +91,20 @@ class CommentProcessor:
                     associated_element = None
                 continue
 
-            # Check for inline comments
-            comment_match = self.inline_comment_pattern.search(line)
+            # Check for inline comments; most lines have no '#' at all
+            comment_match = self.inline_comment_pattern.search(line) if '#' in line else None
             if comment_match:
                 comment_text = comment_match.group().strip()
+                upper_text = comment_text.upper()
                 tags = []
                 comment_type = CommentType.INLINE
 
-                if self.todo_fixme_pattern.search(line):
-                    if 'TODO' in comment_text.upper():
+                # The tag pattern can only matter when the comment mentions a tag
+                if ('TODO' in upper_text or 'FIXME' in upper_text) and self.todo_fixme_pattern.search(line):
+                    if 'TODO' in upper_text:
                         comment_type = CommentType.TODO
                         tags.append('TODO')
-                    elif 'FIXME' in comment_text.upper():
+                    elif 'FIXME' in upper_text:
                         comment_type = CommentType.FIXME
                         tags.append('FIXME')
 
@@ -6,6 +6,12 @@ import logging
 import yaml
 from pathlib import Path
 
+# libyaml's C loader is about ten times faster, but PyYAML can be built without it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 class ConfigType(Enum):
     ENV = "environment"
     INI = "ini"
@@ -14,6 +20,8 @@ class ConfigType(Enum):
     UNKNOWN = "unknown"
 
 class ConfigInfo:
+    __slots__ = ('config_type', 'data')
+
     def __init__(self, config_type: ConfigType, data: Dict):
         self.config_type = config_type
         self.data = data
@@ -104,7 +112,7 @@ class ConfigFileParser:
     def _parse_yaml(self, content: str) -> Dict:
         """Parse YAML file content."""
         try:
-            return yaml.safe_load(content) or {}
+            return yaml.load(content, Loader=SafeLoader) or {}
         except yaml.YAMLError as e:
             logging.error(f"Error parsing YAML content: {str(e)}")
             return {}
@@ -141,8 +149,9 @@ class ConfigFileParser:
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 for line in f:
-                    line = line.strip()
-                    match = self.import_pattern.match(line)
+                    if 'import' not in line:
+                        continue
+                    match = self.import_pattern.match(line.strip())
                     if match:
                         module_from, imported = match.groups()
                         if module_from:
@@ -1,12 +1,17 @@
 import os
 import re
+import sys
 import logging
 from typing import Dict, List, Set, Optional
 from dataclasses import dataclass
-import toml
 import json
 
-@dataclass
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+
+@dataclass(slots=True)
 class Dependency:
     name: str
     version: Optional[str] = None
@@ -21,6 +26,11 @@ class DependencyMapper:
         self.version_pattern = re.compile(r'^([^=<>!~]+)(?:[=<>!~]=?|@)(.+)$')
         self.import_pattern = re.compile(r'^(?:from\s+(\S+)\s+)?import\s+(.+)$')
         self.extras_pattern = re.compile(r'\[(.*?)\]')
+        # The literals are matched up to the first closing bracket with a negated
+        # class, which is what the lazy '.*?' found too, without the per-character retries
+        self.install_requires_pattern = re.compile(r'install_requires\s*=\s*\[([^\]]*)\]')
+        self.extras_require_pattern = re.compile(r'extras_require\s*=\s*{([^}]*)}')
+        self.extras_entry_pattern = re.compile(r"'([^']+)'\s*:\s*\[([^\]]*)\]")
         
     def extract_requirements(self, file_path: str) -> List[Dependency]:
         """Extract dependencies from requirements.txt."""
@@ -54,8 +64,8 @@ class DependencyMapper:
         """Extract dependencies from Pipfile."""
         dependencies = []
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = toml.load(f)
+            with open(file_path, 'rb') as f:
+                content = tomllib.load(f)
                 
             for section in ['packages', 'dev-packages']:
                 if section in content:
@@ -80,7 +90,7 @@ class DependencyMapper:
                 content = f.read()
                 
             # Look for install_requires list
-            install_requires = re.search(r'install_requires\s*=\s*\[(.*?)\]', content, re.DOTALL)
+            install_requires = self.install_requires_pattern.search(content)
             if install_requires:
                 deps = install_requires.group(1).split(',')
                 for dep in deps:
@@ -94,10 +104,10 @@ class DependencyMapper:
                             dependencies.append(Dependency(dep))
                             
             # Look for extras_require dict
-            extras_require = re.search(r'extras_require\s*=\s*{(.*?)}', content, re.DOTALL)
+            extras_require = self.extras_require_pattern.search(content)
             if extras_require:
                 extras_content = extras_require.group(1)
-                extras_matches = re.finditer(r"'([^']+)'\s*:\s*\[(.*?)\]", extras_content, re.DOTALL)
+                extras_matches = self.extras_entry_pattern.finditer(extras_content)
                 for match in extras_matches:
                     extra_name = match.group(1)
                     extra_deps = match.group(2).split(',')
@@ -120,8 +130,8 @@ class DependencyMapper:
         """Extract dependencies from pyproject.toml."""
         dependencies = []
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = toml.load(f)
+            with open(file_path, 'rb') as f:
+                content = tomllib.load(f)
                 
             # Handle poetry dependencies
             if 'tool' in content and 'poetry' in content['tool']:
@@ -155,9 +165,12 @@ class DependencyMapper:
     def extract_imports(self, content: str) -> Set[str]:
         """Extract import statements from Python code."""
         imports = set()
+        match_import = self.import_pattern.match
         for line in content.splitlines():
-            line = line.strip()
-            match = self.import_pattern.match(line)
+            # Only lines containing the keyword can match, so skip the rest unstripped
+            if 'import' not in line:
+                continue
+            match = match_import(line.strip())
             if match:
                 module_from, imported = match.groups()
                 if module_from:
@@ -177,7 +190,9 @@ class DependencyMapper:
                         with open(file_path, 'r', encoding='utf-8') as f:
                             content = f.read()
                         imports = self.extract_imports(content)
-                        hierarchy[rel_path] = list(imports)
+                        # The same modules are imported all over a codebase; interned,
+                        # every file's list points at one copy of each name
+                        hierarchy[rel_path] = [sys.intern(name) for name in imports]
                     except Exception as e:
                         logging.error(f"Error processing {file_path}: {str(e)}")
                         
@@ -1,16 +1,22 @@
 # regex_components/DocumentationAnalyzer.py
 
 import re
+from bisect import bisect_left
 from typing import List, Optional
 
 
 class Section:
+    # One instance per heading, so no per-instance __dict__
+    __slots__ = ('title', 'content')
+
     def __init__(self, title: str, content: str):
         self.title = title
         self.content = content
 
 
 class DocumentationInfo:
+    __slots__ = ('sections',)
+
     def __init__(self, sections: List[Section]):
         self.sections = sections
 
@@ -22,14 +28,19 @@ class DocumentationAnalyzer:
         self.rst_heading_pattern = re.compile(
             r'^(.*)\n([=~\-`:\'^".#*]{2,})$', re.MULTILINE
         )
+        # The characters rst_heading_pattern accepts in an underline; a line made
+        # only of these, at least two long, underlines the line above it
+        self.rst_underline_chars = '=~-`:\'^".#*'
         # Initialize variables to store total lines and total sections
         self.total_lines = 0
         self.total_sections = 0
 
-    def analyze_documentation(self, file_path: str) -> Optional[DocumentationInfo]:
+    def analyze_documentation(self, file_path: str, content: Optional[str] = None) -> Optional[DocumentationInfo]:
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Callers that already read the file can pass its content along
+            if content is None:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
 
             if file_path.endswith('.md'):
                 sections = self._parse_markdown(content)
@@ -51,73 +62,75 @@ class DocumentationAnalyzer:
 
     def _parse_markdown(self, content: str) -> List[Section]:
         sections = []
-        lines = content.split('\n')
         current_section_title = None
-        current_section_content = []
-
-        for line in lines:
-            heading_match = self.md_heading_pattern.match(line)
+        # Headings start with '#', so only those lines are visited, found with
+        # str.find; a section's content is then sliced straight out of `content`
+        section_start = 0
+        line_start = 0 if content.startswith('#') else self._next_hash_line(content, 0)
+
+        while line_start is not None:
+            line_end = content.find('\n', line_start)
+            if line_end == -1:
+                line_end = len(content)
+            heading_match = self.md_heading_pattern.match(content[line_start:line_end])
             if heading_match:
-                # Save the previous section
+                # Save the previous section; an empty title collects no content
                 if current_section_title is not None:
                     sections.append(
                         Section(
                             title=current_section_title,
-                            content='\n'.join(current_section_content).strip(),
+                            content=content[section_start:line_start - 1].strip() if current_section_title else '',
                         )
                     )
-                    current_section_content = []
 
                 current_section_title = heading_match.group(2).strip()
-            else:
-                if current_section_title:
-                    current_section_content.append(line)
+                section_start = line_end + 1
+            line_start = self._next_hash_line(content, line_end)
 
         # Save the last section
         if current_section_title:
             sections.append(
                 Section(
                     title=current_section_title,
-                    content='\n'.join(current_section_content).strip(),
+                    content=content[section_start:].strip(),
                 )
             )
 
         return sections
 
+    @staticmethod
+    def _next_hash_line(content: str, pos: int) -> Optional[int]:
+        """Returns the offset of the next line after pos that starts with '#', or None."""
+        newline = content.find('\n#', pos)
+        return None if newline == -1 else newline + 1
+
     def _parse_restructuredtext(self, content: str) -> List[Section]:
         sections = []
         lines = content.split('\n')
-        idx = 0
         total_lines = len(lines)
 
-        while idx < total_lines:
-            line = lines[idx]
-            if idx + 1 < total_lines:
-                next_line = lines[idx + 1]
-                heading_match = self.rst_heading_pattern.match(line + '\n' + next_line)
-                if heading_match:
-                    title = heading_match.group(1).strip()
-                    underline = heading_match.group(2).strip()
-                    idx += 2  # Skip the heading and underline
-                    section_content = []
-
-                    while idx < total_lines:
-                        if idx + 1 < total_lines and self.rst_heading_pattern.match(
-                            lines[idx] + '\n' + lines[idx + 1]
-                        ):
-                            break
-                        section_content.append(lines[idx])
-                        idx += 1
-
-                    sections.append(
-                        Section(
-                            title=title, content='\n'.join(section_content).strip()
-                        )
-                    )
-                else:
-                    idx += 1
-            else:
-                idx += 1
+        # Find every heading once, by its underline, instead of re-matching
+        # each pair of lines against rst_heading_pattern as the sections are walked
+        underline_chars = self.rst_underline_chars
+        headings = [
+            idx for idx in range(total_lines - 1)
+            if len(lines[idx + 1]) >= 2 and not lines[idx + 1].strip(underline_chars)
+        ]
+
+        # A section runs from below its underline to the next heading; headings
+        # that fall inside a section (such as the underline line itself) are skipped
+        section_end = 0
+        for idx in headings:
+            if idx < section_end:
+                continue
+            next_heading = bisect_left(headings, idx + 2)
+            section_end = headings[next_heading] if next_heading < len(headings) else total_lines
+            sections.append(
+                Section(
+                    title=lines[idx].strip(),
+                    content='\n'.join(lines[idx + 2:section_end]).strip(),
+                )
+            )
 
         return sections
 
@@ -1,6 +1,8 @@
 # FileTypeProcessor.py
 
 import os
+import stat
+import sys
 import chardet
 from typing import Optional
 from enum import Enum
@@ -23,6 +25,9 @@ class FileType(Enum):
 
 
 class FileInfo:
+    # One instance per generic file, so no per-instance __dict__
+    __slots__ = ('type', 'encoding', 'extension', 'purpose')
+
     def __init__(self, type: FileType, encoding: Optional[str], extension: str, purpose: str):
         self.type = type
         self.encoding = encoding
@@ -68,20 +73,29 @@ class FileTypeProcessor:
     def process_file(self, file_path: str) -> Optional[FileInfo]:
         """
         Determines the file type, encoding, extension, and purpose.
+
+        The file is stat'ed once and opened once; the bytes read for encoding
+        detection also answer the shebang check.
         """
-        if not os.path.isfile(file_path):
+        try:
+            if not stat.S_ISREG(os.stat(file_path).st_mode):
+                return None
+        except (OSError, ValueError):
             return None
 
         _, ext = os.path.splitext(file_path)
-        ext = ext.lower()
+        # A handful of extensions cover most files; interned, every FileInfo
+        # shares one copy of each instead of holding its own
+        ext = sys.intern(ext.lower())
 
         file_type = self.extension_map.get(ext, FileType.OTHER)
 
-        encoding = self.detect_file_encoding(file_path)
+        header = self._read_header(file_path)
+        encoding = self._detect_encoding(header)
         if encoding is None and file_type == FileType.OTHER:
             file_type = FileType.BINARY
 
-        purpose = self.determine_file_purpose(file_path, file_type)
+        purpose = self.determine_file_purpose(file_path, file_type, header)
 
         file_info = FileInfo(
             type=file_type,
@@ -96,31 +110,54 @@ class FileTypeProcessor:
         """
         Detects the file encoding using chardet library.
         """
+        return self._detect_encoding(self._read_header(file_path))
+
+    def _read_header(self, file_path: str) -> Optional[bytes]:
+        """
+        Reads the bytes encoding detection looks at, or None if the file cannot be read.
+        """
+        try:
+            # Unbuffered, so a binary file with a null byte in its header (most
+            # images and archives) is rejected without reading the rest of the 10KB
+            with open(file_path, 'rb', buffering=0) as f:
+                rawdata = f.read(512)
+                if b'\x00' not in rawdata:
+                    rawdata += f.read(10000 - len(rawdata))  # Read first 10KB
+            return rawdata
+        except Exception:
+            return None
+
+    def _detect_encoding(self, rawdata: Optional[bytes]) -> Optional[str]:
+        """
+        Detects the encoding of a file header read by _read_header.
+        """
+        if rawdata is None or b'\x00' in rawdata:
+            # Unreadable, or a null byte detected, likely a binary file
+            return None
         try:
-            with open(file_path, 'rb') as f:
-                rawdata = f.read(10000)  # Read first 10KB
-            if b'\x00' in rawdata:
-                # Null byte detected, likely a binary file
-                return None
             result = chardet.detect(rawdata)
             encoding = result['encoding']
             return encoding
         except Exception:
             return None
 
-    def determine_file_purpose(self, file_path: str, file_type: FileType) -> str:
+    def determine_file_purpose(self, file_path: str, file_type: FileType, header: Optional[bytes] = None) -> str:
         """
         Determines the file's purpose based on its type, location, and content.
+
+        header is the start of the file if it has already been read; otherwise
+        the file is opened for the shebang check.
         """
         purpose = file_type.value
 
-        # Infer purpose from file path
+        # Infer purpose from file path; these are substring checks, so 'test'
+        # also covers 'tests', 'doc' covers 'docs' and 'example' covers 'examples'
         path_lower = file_path.lower()
-        if 'test' in path_lower or 'tests' in path_lower:
+        if 'test' in path_lower:
             purpose = 'test_code'
-        elif 'doc' in path_lower or 'docs' in path_lower:
+        elif 'doc' in path_lower:
             purpose = 'documentation'
-        elif 'example' in path_lower or 'examples' in path_lower:
+        elif 'example' in path_lower:
             purpose = 'example_code'
         elif file_type == FileType.CONFIG:
             purpose = 'configuration'
@@ -134,7 +171,10 @@ class FileTypeProcessor:
             purpose = 'other'
 
         # Check for shebang line to identify scripts
-        if file_type == FileType.SOURCE_CODE:
+        if file_type == FileType.SOURCE_CODE and header is not None:
+            if header.startswith(b'#!'):
+                purpose = 'executable_script'
+        elif file_type == FileType.SOURCE_CODE:
             try:
                 with open(file_path, 'r', encoding='utf-8') as f:
                     first_line = f.readline()
@@ -11,11 +11,18 @@ class IntegrationMapper:
 
     def __init__(self):
         # Precompile regex patterns for efficiency
+        # The case-insensitive patterns start with a plain class of their possible
+        # first letters (with the 'ſ' that (?i) folds to 's'), which lets the engine
+        # skip to candidate positions; a lookbehind on that letter picks the branch.
+        # (?<!\w.) is the \b before the scheme, checked one character later.
         self.url_pattern = re.compile(
-            r"""(?i)\b(?:https?://|ftp://|file://|mailto:|tel:|data:)[^\s'"]+"""
+            r"""[HhFfMmTtDd](?<!\w.)"""
+            r"""(?:(?<=[Hh])(?i:ttps?://)|(?<=[Ff])(?i:tp://|ile://)|(?<=[Mm])(?i:ailto:)"""
+            r"""|(?<=[Tt])(?i:el:)|(?<=[Dd])(?i:ata:))(?i:[^\s'"]+)"""
         )
+        # api_key, apikey, apiKey and API_KEY are all api_?key ignoring case
         self.api_key_pattern = re.compile(
-            r"""(?i)(?:api_key|apikey|apiKey|API_KEY)\s*[:=]\s*['"]([A-Za-z0-9-_]{20,})['"]"""
+            r"""[Aa](?i:pi_?key\s*[:=]\s*['"]([A-Za-z0-9-_]{20,})['"])"""
         )
         self.import_pattern = re.compile(
             r"""^\s*import\s+([a-zA-Z0-9_.]+)|^\s*from\s+([a-zA-Z0-9_.]+)\s+import\s+"""
@@ -27,13 +34,19 @@ class IntegrationMapper:
             r"""(?:connect|setup_connection|configure)\s*\(\s*['"]([a-zA-Z0-9_.]+)['"]\s*,\s*['"]([a-zA-Z0-9_.:/\-]+)['"]"""
         )
         self.credentials_pattern = re.compile(
-            r"""(?i)(?:username|user|password|pwd|secret|token)\s*[:=]\s*['"]([^'"]+)['"]"""
+            r"""[UuPpSsſTt](?:(?<=[Uu])(?i:ser(?:name)?)|(?<=[Pp])(?i:assword|wd)"""
+            r"""|(?<=[Ssſ])(?i:ecret)|(?<=[Tt])(?i:oken))(?i:\s*[:=]\s*['"]([^'"]+)['"])"""
         )
         self.external_libs = set([
             'requests', 'boto3', 'django', 'flask', 'sqlalchemy', 'celery',
             'stripe', 'twilio', 'firebase', 'pandas', 'numpy', 'torch', 'tensorflow',
             'google', 'aws', 'azure', 'slack_sdk', 'discord', 'facebook', 'twitter'
         ])
+        # Literal substrings every match of the case-insensitive patterns must
+        # contain, checked against the casefolded content to skip whole scans
+        self.url_anchors = ('://', 'lto:', 'tel:', 'data:')
+        self.api_key_anchors = ('key',)
+        self.credentials_anchors = ('user', 'password', 'pwd', 'secret', 'token')
 
     def extract_integrations(self, content: str) -> List[Dict[str, Any]]:
         """
@@ -43,37 +56,34 @@ class IntegrationMapper:
         :return: A list of dictionaries containing integration details.
         """
         integrations = []
+        # Each integration is keyed by its type and fields, and only built the
+        # first time that key is seen
+        seen = set()
+        folded = content.casefold()
 
         # Extract URLs
-        urls = self.url_pattern.findall(content)
-        for url in urls:
-            integrations.append({
-                'type': 'URL',
-                'value': url
-            })
+        urls = self.url_pattern.findall(content) if self._has_anchor(folded, self.url_anchors) else []
+        self._add_values(integrations, seen, 'URL', urls)
 
         # Extract API keys
-        api_keys = self.api_key_pattern.findall(content)
-        for key in api_keys:
-            integrations.append({
-                'type': 'API Key',
-                'value': key
-            })
+        api_keys = self.api_key_pattern.findall(content) if self._has_anchor(folded, self.api_key_anchors) else []
+        self._add_values(integrations, seen, 'API Key', api_keys)
 
         # Extract imported external libraries
         imports = self.import_pattern.findall(content)
-        for imp in imports:
-            module = imp[0] if imp[0] else imp[1]
-            if module.split('.')[0] in self.external_libs:
-                integrations.append({
-                    'type': 'External Library',
-                    'value': module
-                })
+        modules = [imp[0] if imp[0] else imp[1] for imp in imports]
+        self._add_values(
+            integrations, seen, 'External Library',
+            [module for module in modules if module.split('.')[0] in self.external_libs]
+        )
 
         # Extract SDK initialization
         sdk_inits = self.sdk_init_pattern.findall(content)
-        for sdk_init in sdk_inits:
-            sdk_name, api_key = sdk_init
+        for sdk_name, api_key in sdk_inits:
+            key = ('SDK Initialization', sdk_name, api_key)
+            if key in seen:
+                continue
+            seen.add(key)
             integration = {
                 'type': 'SDK Initialization',
                 'sdk_name': sdk_name
@@ -85,6 +95,10 @@ class IntegrationMapper:
         # Extract service connections
         service_connections = self.service_connection_pattern.findall(content)
         for connection in service_connections:
+            key = ('Service Connection',) + connection
+            if key in seen:
+                continue
+            seen.add(key)
             service_name, endpoint = connection
             integrations.append({
                 'type': 'Service Connection',
@@ -93,20 +107,24 @@ class IntegrationMapper:
             })
 
         # Extract credentials
-        credentials = self.credentials_pattern.findall(content)
-        for credential in credentials:
-            integrations.append({
-                'type': 'Credential',
-                'value': credential
-            })
+        credentials = self.credentials_pattern.findall(content) if self._has_anchor(folded, self.credentials_anchors) else []
+        self._add_values(integrations, seen, 'Credential', credentials)
 
-        # Remove duplicates by converting list of dicts to a set of tuples and back
-        unique_integrations = []
-        seen = set()
-        for integration in integrations:
-            integration_tuple = tuple(sorted(integration.items()))
-            if integration_tuple not in seen:
-                seen.add(integration_tuple)
-                unique_integrations.append(integration)
+        return integrations
+
+    @staticmethod
+    def _add_values(integrations: List[Dict[str, Any]], seen: set, integration_type: str, values) -> None:
+        """Appends a {'type', 'value'} integration for each value not seen before."""
+        for value in values:
+            key = (integration_type, value)
+            if key not in seen:
+                seen.add(key)
+                integrations.append({
+                    'type': integration_type,
+                    'value': value
+                })
 
-        return unique_integrations
+    @staticmethod
+    def _has_anchor(folded: str, anchors) -> bool:
+        """Checks whether any of the anchor substrings occurs in the casefolded content."""
+        return any(anchor in folded for anchor in anchors)
@@ -18,12 +18,12 @@ class LocalizationProcessor:
         self.gettext_pattern = re.compile(
             r"""_\(\s*['"](.+?)['"]\s*\)"""
         )
+        # MULTILINE, so every entry is found rather than only one at the start of the file
         self.po_entry_pattern = re.compile(
-            r"""^msgid\s+['"](.+?)['"]\s*\nmsgstr\s+['"](.+?)['"]"""
-        )
-        self.mo_entry_pattern = re.compile(
-            r"""^\x95\x04\x12\xde"""  # MO file magic number
+            r"""^msgid\s+['"](.+?)['"]\s*\nmsgstr\s+['"](.+?)['"]""", re.MULTILINE
         )
+        # MO file magic number, as written by little- and big-endian machines
+        self.mo_magic_numbers = (b'\xde\x12\x04\x95', b'\x95\x04\x12\xde')
 
     def extract_localizations(self, content: str) -> List[Dict[str, Any]]:
         """
@@ -82,7 +82,7 @@ class LocalizationProcessor:
         :param content: The byte content of the file.
         :return: True if it's a .mo file, else False.
         """
-        return bool(self.mo_entry_pattern.match(content.decode('latin1', errors='ignore')))
+        return content.startswith(self.mo_magic_numbers)
 
     def extract_localization_files(self, file_path: str) -> Dict[str, Any]:
         """
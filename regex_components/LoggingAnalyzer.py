@@ -1,5 +1,6 @@
 # LoggingAnalyzer.py
 import re
+from bisect import bisect_right
 from typing import List, Dict, Any
 import ast
 import logging
@@ -11,14 +12,18 @@ class LoggingAnalyzer:
     """
 
     def __init__(self):
-        self.logging_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-        logging.basicConfig(level=logging.INFO)
+        self.logging_levels = frozenset(('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'))
+        self.log_call_pattern = re.compile(r'logging\.(debug|info|warning|error|critical)\s*\(\s*(.*?)\s*\)', re.DOTALL)
+        self.newline_pattern = re.compile('\n')
 
     def extract_logs(self, file_content: str) -> List[Dict[str, Any]]:
         """
         Extracts logging statements from the provided Python code.
         """
         logs = []
+        # Only calls on the `logging` name are reported, so skip the parse without it
+        if 'logging' not in file_content:
+            return logs
         try:
             tree = ast.parse(file_content)
             for node in ast.walk(tree):
@@ -31,7 +36,8 @@ class LoggingAnalyzer:
                                     'level': func.attr.upper(),
                                     'message': self._extract_message(node),
                                     'line_number': node.lineno,
-                                    'module': self._get_module_name(node),
+                                    # ast nodes carry no parent links, so the module is never known here
+                                    'module': '<unknown>',
                                 }
                                 logs.append(log_entry)
         except Exception as e:
@@ -52,16 +58,6 @@ class LoggingAnalyzer:
                 return ast.unparse(first_arg) if hasattr(ast, 'unparse') else '<complex expression>'
         return ''
 
-    def _get_module_name(self, node: ast.AST) -> str:
-        """
-        Attempts to retrieve the module name where the logging call is made.
-        """
-        while node:
-            if isinstance(node, ast.Module):
-                return getattr(node, 'name', '<unknown>')
-            node = getattr(node, 'parent', None)
-        return '<unknown>'
-
     def analyze_file(self, file_path: str) -> List[Dict[str, Any]]:
         """
         Analyzes a Python file for logging statements.
@@ -78,15 +74,17 @@ class LoggingAnalyzer:
         """
         Alternative method using regex to extract logging statements.
         """
-        pattern = re.compile(r'logging\.(debug|info|warning|error|critical)\s*\(\s*(.*?)\s*\)', re.DOTALL)
         logs = []
-        for match in pattern.finditer(file_content):
+        line_starts = None
+        for match in self.log_call_pattern.finditer(file_content):
+            if line_starts is None:
+                line_starts = self._get_line_starts(file_content)
             level = match.group(1).upper()
             message = match.group(2)
             logs.append({
                 'level': level,
                 'message': message.strip('"\''),
-                'line_number': self._get_line_number(file_content, match.start()),
+                'line_number': bisect_right(line_starts, match.start()),
                 'module': '<unknown>',
             })
         return logs
@@ -96,3 +94,12 @@ class LoggingAnalyzer:
         Calculates the line number in the content string for a given index.
         """
         return content.count('\n', 0, index) + 1
+
+    def _get_line_starts(self, content: str) -> List[int]:
+        """
+        Returns the offset at which each line of the content starts.
+
+        Bisecting a match offset into this list gives its line number without
+        recounting newlines from the start of the file for every match.
+        """
+        return [0] + [match.end() for match in self.newline_pattern.finditer(content)]
@@ -10,6 +10,21 @@ class VersionAnalyzer:
         """Initialize the VersionAnalyzer with the directory to analyze."""
         self.directory = directory
 
+        # Precompile the patterns used on every analyzed file
+        self.version_pattern = re.compile(r'(>=|<=|==|!=|>|<)\s*(\d+\.\d+(?:\.\d+)?)')
+        self.requires_python_pattern = re.compile(r'Requires-Python\s*[:=]\s*([^\n]+)')
+        self.deprecated_pattern = re.compile(r'@deprecated(?:\((.*?)\))?')
+        self.comment_version_pattern = re.compile(r'#.*?(Python\s*(\d+\.\d+(?:\.\d+)?))')
+        self.deprecation_warning_pattern = re.compile(r'warnings\.warn\([\'"]([^\'"]+)[\'"].*DeprecationWarning')
+
+        # Patterns for the Python version declared in each config file
+        self.config_python_version_patterns = {
+            'setup.py': re.compile(r'python_requires\s*=\s*[\'"]([^\'"]+)[\'"]'),
+            'setup.cfg': re.compile(r'Requires-Python\s*=\s*([^\n]+)'),
+            'pyproject.toml': re.compile(r'requires-python\s*=\s*[\'"]([^\'"]+)[\'"]'),
+            'Pipfile': re.compile(r'python_version\s*=\s*[\'"]([^\'"]+)[\'"]'),
+        }
+
     def extract_version_constraints(self, content: str) -> Dict[str, Any]:
         """
         Extracts version constraints from the given content.
@@ -18,8 +33,7 @@ class VersionAnalyzer:
         version_info = {}
 
         # Pattern to find version constraints like '>=3.6', '==2.7'
-        version_pattern = re.compile(r'(>=|<=|==|!=|>|<)\s*(\d+\.\d+(?:\.\d+)?)')
-        matches = version_pattern.findall(content)
+        matches = self.version_pattern.findall(content)
         if matches:
             version_constraints = []
             for operator, version in matches:
@@ -27,27 +41,23 @@ class VersionAnalyzer:
             version_info['python_version_constraints'] = version_constraints
 
         # Find Requires-Python in setup.cfg or similar files
-        requires_python_pattern = re.compile(r'Requires-Python\s*[:=]\s*([^\n]+)')
-        requires_python_match = requires_python_pattern.findall(content)
+        requires_python_match = self.requires_python_pattern.findall(content)
         if requires_python_match:
             version_info['requires_python'] = [v.strip() for v in requires_python_match]
 
         # Find deprecation decorators like '@deprecated' or '@deprecated(reason)'
-        deprecated_pattern = re.compile(r'@deprecated(?:\((.*?)\))?')
-        deprecated_matches = deprecated_pattern.findall(content)
+        deprecated_matches = self.deprecated_pattern.findall(content)
         if deprecated_matches:
             version_info['deprecated'] = [dm.strip() for dm in deprecated_matches if dm]
 
         # Find version constraints in comments (e.g., '# Requires Python >=3.6')
-        comment_version_pattern = re.compile(r'#.*?(Python\s*(\d+\.\d+(?:\.\d+)?))')
-        comment_version_matches = comment_version_pattern.findall(content)
+        comment_version_matches = self.comment_version_pattern.findall(content)
         if comment_version_matches:
             comment_versions = [match[0] for match in comment_version_matches]
             version_info['comment_versions'] = comment_versions
 
         # Find deprecation warnings using warnings.warn with DeprecationWarning
-        deprecation_warning_pattern = re.compile(r'warnings\.warn\([\'"]([^\'"]+)[\'"].*DeprecationWarning')
-        deprecation_warnings = deprecation_warning_pattern.findall(content)
+        deprecation_warnings = self.deprecation_warning_pattern.findall(content)
         if deprecation_warnings:
             version_info['deprecation_warnings'] = deprecation_warnings
 
@@ -68,36 +78,11 @@ class VersionAnalyzer:
                 with open(file_path, 'r', encoding='utf-8') as f:
                     content = f.read()
 
-                # Try to find python_requires in setup.py
-                if config_file == 'setup.py':
-                    python_requires_pattern = re.compile(r'python_requires\s*=\s*[\'"]([^\'"]+)[\'"]')
-                    match = python_requires_pattern.search(content)
-                    if match:
-                        python_version = match.group(1).strip()
-                        return python_version
-
-                # Try to find Requires-Python in setup.cfg
-                if config_file == 'setup.cfg':
-                    requires_python_pattern = re.compile(r'Requires-Python\s*=\s*([^\n]+)')
-                    match = requires_python_pattern.search(content)
-                    if match:
-                        python_version = match.group(1).strip()
-                        return python_version
-
-                # Try to find requires-python in pyproject.toml
-                if config_file == 'pyproject.toml':
-                    requires_python_pattern = re.compile(r'requires-python\s*=\s*[\'"]([^\'"]+)[\'"]')
-                    match = requires_python_pattern.search(content)
-                    if match:
-                        python_version = match.group(1).strip()
-                        return python_version
-
-                # Try to find python_version in Pipfile
-                if config_file == 'Pipfile':
-                    python_version_pattern = re.compile(r'python_version\s*=\s*[\'"]([^\'"]+)[\'"]')
-                    match = python_version_pattern.search(content)
-                    if match:
-                        python_version = match.group(1).strip()
-                        return python_version
+                # setup.py: python_requires, setup.cfg: Requires-Python,
+                # pyproject.toml: requires-python, Pipfile: python_version
+                match = self.config_python_version_patterns[config_file].search(content)
+                if match:
+                    python_version = match.group(1).strip()
+                    return python_version
 
         return python_version